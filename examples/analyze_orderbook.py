@@ -1,5 +1,9 @@
+import asyncio
 import os
-from decimal import Decimal
+import sys
+from bisect import bisect_left, bisect_right
+from itertools import accumulate
+from operator import mul
 
 from hl import TESTNET, Account, Api
 
@@ -8,45 +12,68 @@ address = os.environ["HL_ADDRESS"]
 secret_key = os.environ["HL_SECRET_KEY"]
 
 
-def analyze_orderbook_depth(levels: list, side_name: str) -> None:
-    """Analyze and display order book depth for one side."""
-    if not levels:
-        print(f"  No {side_name} orders")
-        return
+def parse_levels(levels: list) -> tuple[list[float], list[float]]:
+    """Parse book levels into parallel price and size lists."""
+    prices = [float(level["px"]) for level in levels]
+    sizes = [float(level["sz"]) for level in levels]
+    return prices, sizes
 
-    total_size = Decimal("0")
-    total_value = Decimal("0")
 
-    print(f"  {side_name} Orders (Top 10):")
-    print(f"    {'Price':>12} {'Size':>12} {'Total Size':>12} {'Total Value':>15}")
-    print(f"    {'-' * 12} {'-' * 12} {'-' * 12} {'-' * 15}")
+def cumulate_levels(
+    prices: list[float], sizes: list[float]
+) -> tuple[list[float], list[float]]:
+    """Compute the running total size and notional value for one side."""
+    cum_sizes = list(accumulate(sizes))
+    cum_values = list(accumulate(map(mul, prices, sizes)))
+    return cum_sizes, cum_values
 
-    for i, level in enumerate(levels[:10]):
-        price = Decimal(level["px"])
-        size = Decimal(level["sz"])
-        total_size += size
-        total_value += price * size
 
-        print(
-            f"    ${price:>11.2f} {size:>12.4f} {total_size:>12.4f} ${total_value:>14.2f}"
-        )
+def analyze_orderbook_depth(
+    prices: list[float],
+    sizes: list[float],
+    cum_sizes: list[float],
+    cum_values: list[float],
+    side_name: str,
+) -> None:
+    """Analyze and display order book depth for one side."""
+    if not prices:
+        print(f"  No {side_name} orders")
+        return
 
-    print(f"    Total {side_name} Depth: {total_size:.4f} (${total_value:.2f})")
+    prices, sizes = prices[:10], sizes[:10]
+    cum_sizes, cum_values = cum_sizes[:10], cum_values[:10]
+
+    # Build the whole table and write it at once instead of printing per row
+    rows = [
+        f"  {side_name} Orders (Top 10):",
+        f"    {'Price':>12} {'Size':>12} {'Total Size':>12} {'Total Value':>15}",
+        f"    {'-' * 12} {'-' * 12} {'-' * 12} {'-' * 15}",
+    ]
+    rows.extend(
+        f"    ${price:>11.2f} {size:>12.4f} {total_size:>12.4f} ${total_value:>14.2f}"
+        for price, size, total_size, total_value in zip(
+            prices, sizes, cum_sizes, cum_values
+        )
+    )
+    rows.append(
+        f"    Total {side_name} Depth: {cum_sizes[-1]:.4f} (${cum_values[-1]:.2f})"
+    )
+    sys.stdout.write("\n".join(rows) + "\n")
 
 
-def calculate_spread_metrics(bids: list, asks: list) -> dict:
+def calculate_spread_metrics(bid_prices: list[float], ask_prices: list[float]) -> dict:
     """Calculate spread and related metrics."""
-    if not bids or not asks:
+    if not bid_prices or not ask_prices:
         return {
-            "spread": 0,
-            "spread_pct": 0,
-            "mid_price": 0,
-            "best_bid": 0,
-            "best_ask": 0,
+            "spread": 0.0,
+            "spread_pct": 0.0,
+            "mid_price": 0.0,
+            "best_bid": 0.0,
+            "best_ask": 0.0,
         }
 
-    best_bid = Decimal(bids[0]["px"])
-    best_ask = Decimal(asks[0]["px"])
+    best_bid = bid_prices[0]
+    best_ask = ask_prices[0]
     mid_price = (best_bid + best_ask) / 2
     spread = best_ask - best_bid
     spread_pct = (spread / mid_price) * 100
@@ -61,37 +88,51 @@ def calculate_spread_metrics(bids: list, asks: list) -> dict:
 
 
 def find_liquidity_at_distance(
-    levels: list, reference_price: Decimal, distance_pct: float
+    distances: list[float],
+    cum_sizes: list[float],
+    cum_values: list[float],
+    distance_pct: float,
 ) -> dict:
-    """Find liquidity within a certain percentage distance from reference price."""
-    if not levels:
-        return {"total_size": 0, "total_value": 0, "order_count": 0}
-
-    total_size = Decimal("0")
-    total_value = Decimal("0")
-    order_count = 0
-
-    for level in levels:
-        price = Decimal(level["px"])
-        size = Decimal(level["sz"])
+    """Find liquidity within a certain percentage distance from reference price.
 
-        # Calculate distance from reference price
-        distance = abs(price - reference_price) / reference_price * 100
-
-        if distance <= distance_pct:
-            total_size += size
-            total_value += price * size
-            order_count += 1
-        else:
-            break  # Orders are sorted by price, so we can stop here
+    `distances` holds the percentage distance of each level from the reference
+    price. Levels are sorted away from the mid, so the distances are
+    non-decreasing and the cutoff can be found with a binary search.
+    """
+    order_count = bisect_right(distances, distance_pct)
+    if not order_count:
+        return {"total_size": 0.0, "total_value": 0.0, "order_count": 0}
 
     return {
-        "total_size": total_size,
-        "total_value": total_value,
+        "total_size": cum_sizes[order_count - 1],
+        "total_value": cum_values[order_count - 1],
         "order_count": order_count,
     }
 
 
+def walk_book(
+    prices: list[float],
+    cum_sizes: list[float],
+    cum_values: list[float],
+    size: float,
+) -> tuple[float, int, bool]:
+    """Walk one side of the book to fill `size`.
+
+    Returns:
+        The total cost of the fill, the number of levels used and whether the
+        book had enough liquidity to fill the whole size.
+    """
+    # Index of the last level touched when filling `size`
+    k = bisect_left(cum_sizes, size)
+    if k == len(prices):
+        return (cum_values[-1] if k else 0.0), k, False
+
+    filled_size = cum_sizes[k - 1] if k else 0.0
+    filled_value = cum_values[k - 1] if k else 0.0
+    cost = filled_value + prices[k] * (size - filled_size)
+    return cost, k + 1, True
+
+
 async def main() -> None:
     # Create account and API client
     account = Account(address=address, secret_key=secret_key)
@@ -106,12 +147,15 @@ async def main() -> None:
     print("=== Order Book Analysis ===")
     print()
 
-    for asset in assets:
+    # Fetch all L2 order books concurrently, then analyze them locally
+    book_results = await asyncio.gather(
+        *(api.info.l2_book(asset=asset) for asset in assets)
+    )
+
+    for asset, book_result in zip(assets, book_results):
         print(f"📊 {asset} Order Book Analysis")
         print("=" * 40)
 
-        # Get L2 order book
-        book_result = await api.info.l2_book(asset=asset)
         if book_result.is_err():
             print(f"Error getting {asset} order book: {book_result.unwrap_err()}")
             continue
@@ -120,8 +164,14 @@ async def main() -> None:
         bids = book.get("levels", [[], []])[0]  # Buy orders
         asks = book.get("levels", [[], []])[1]  # Sell orders
 
+        # Parse each side once and share the lists across all analyses below
+        bid_px, bid_sz = parse_levels(bids)
+        ask_px, ask_sz = parse_levels(asks)
+        bid_cum_sz, bid_cum_val = cumulate_levels(bid_px, bid_sz)
+        ask_cum_sz, ask_cum_val = cumulate_levels(ask_px, ask_sz)
+
         # Calculate basic metrics
-        metrics = calculate_spread_metrics(bids, asks)
+        metrics = calculate_spread_metrics(bid_px, ask_px)
 
         print(f"📈 Market Metrics:")
         print(f"  Mid Price: ${metrics['mid_price']:.2f}")
@@ -132,18 +182,25 @@ async def main() -> None:
 
         # Analyze order book depth
         print(f"📚 Order Book Depth:")
-        analyze_orderbook_depth(bids, "Bid")
+        analyze_orderbook_depth(bid_px, bid_sz, bid_cum_sz, bid_cum_val, "Bid")
         print()
-        analyze_orderbook_depth(asks, "Ask")
+        analyze_orderbook_depth(ask_px, ask_sz, ask_cum_sz, ask_cum_val, "Ask")
         print()
 
         # Liquidity analysis at different distances
         print(f"💧 Liquidity Analysis:")
         distances = [0.1, 0.5, 1.0, 2.0]  # Percentage distances
+        mid_price = metrics["mid_price"]
+        bid_dist = [abs(px - mid_price) / mid_price * 100 for px in bid_px]
+        ask_dist = [abs(px - mid_price) / mid_price * 100 for px in ask_px]
 
         for distance in distances:
-            bid_liq = find_liquidity_at_distance(bids, metrics["mid_price"], distance)
-            ask_liq = find_liquidity_at_distance(asks, metrics["mid_price"], distance)
+            bid_liq = find_liquidity_at_distance(
+                bid_dist, bid_cum_sz, bid_cum_val, distance
+            )
+            ask_liq = find_liquidity_at_distance(
+                ask_dist, ask_cum_sz, ask_cum_val, distance
+            )
 
             print(f"  Within {distance}%:")
             print(
@@ -155,75 +212,44 @@ async def main() -> None:
 
             total_liquidity = bid_liq["total_size"] + ask_liq["total_size"]
             imbalance = abs(bid_liq["total_size"] - ask_liq["total_size"]) / max(
-                total_liquidity, Decimal("0.0001")
+                total_liquidity, 0.0001
             )
             print(f"    Total: {total_liquidity:.4f}, Imbalance: {imbalance:.1%}")
             print()
 
         # Market depth analysis
         print(f"🎯 Market Impact Analysis:")
-        impact_sizes = [Decimal("0.1"), Decimal("0.5"), Decimal("1.0"), Decimal("5.0")]
+        impact_sizes = [0.1, 0.5, 1.0, 5.0]
+        rows = []
 
         for size in impact_sizes:
-            # Calculate impact for buying
-            buy_cost = Decimal("0")
-            buy_size_remaining = size
-            buy_levels_used = 0
-
-            for level in asks:
-                if buy_size_remaining <= 0:
-                    break
-
-                price = Decimal(level["px"])
-                available = Decimal(level["sz"])
-                take_size = min(buy_size_remaining, available)
-
-                buy_cost += price * take_size
-                buy_size_remaining -= take_size
-                buy_levels_used += 1
-
-            # Calculate impact for selling
-            sell_value = Decimal("0")
-            sell_size_remaining = size
-            sell_levels_used = 0
-
-            for level in bids:
-                if sell_size_remaining <= 0:
-                    break
-
-                price = Decimal(level["px"])
-                available = Decimal(level["sz"])
-                take_size = min(sell_size_remaining, available)
-
-                sell_value += price * take_size
-                sell_size_remaining -= take_size
-                sell_levels_used += 1
+            buy_cost, buy_levels_used, buy_filled = walk_book(
+                ask_px, ask_cum_sz, ask_cum_val, size
+            )
+            sell_value, sell_levels_used, sell_filled = walk_book(
+                bid_px, bid_cum_sz, bid_cum_val, size
+            )
 
-            if buy_size_remaining == 0 and sell_size_remaining == 0:
+            if buy_filled and sell_filled:
                 buy_avg_price = buy_cost / size
                 sell_avg_price = sell_value / size
 
-                buy_impact = (
-                    (buy_avg_price - metrics["mid_price"]) / metrics["mid_price"]
-                ) * 100
-                sell_impact = (
-                    (metrics["mid_price"] - sell_avg_price) / metrics["mid_price"]
-                ) * 100
+                buy_impact = ((buy_avg_price - mid_price) / mid_price) * 100
+                sell_impact = ((mid_price - sell_avg_price) / mid_price) * 100
 
-                print(f"  {size} {asset} trade:")
-                print(
+                rows.append(f"  {size} {asset} trade:")
+                rows.append(
                     f"    Buy: ${buy_avg_price:.2f} avg ({buy_impact:+.2f}% impact, {buy_levels_used} levels)"
                 )
-                print(
+                rows.append(
                     f"    Sell: ${sell_avg_price:.2f} avg ({sell_impact:+.2f}% impact, {sell_levels_used} levels)"
                 )
             else:
-                print(f"  {size} {asset} trade: Insufficient liquidity")
+                rows.append(f"  {size} {asset} trade: Insufficient liquidity")
 
+        sys.stdout.write("\n".join(rows) + "\n")
         print("\n" + "=" * 60 + "\n")
 
 
 if __name__ == "__main__":
-    import asyncio
-
     asyncio.run(main())
@@ -1,3 +1,4 @@
+import asyncio
 import os
 from decimal import Decimal
 
@@ -20,8 +21,23 @@ async def main() -> None:
     print(f"Address: {address}")
     print()
 
-    # Get perpetual account state
-    perp_result = await api.info.user_state()
+    # The requests are independent, so issue them concurrently
+    (
+        perp_result,
+        spot_result,
+        mids_result,
+        orders_result,
+        fills_result,
+    ) = await asyncio.gather(
+        api.info.user_state(),
+        api.info.spot_user_state(),
+        api.info.all_mids(),
+        api.info.user_open_orders(),
+        api.info.user_fills(),
+    )
+    mids = mids_result.unwrap() if mids_result.is_ok() else {}
+
+    # Perpetual account state
     if perp_result.is_ok():
         perp_state = perp_result.unwrap()
 
@@ -54,8 +70,7 @@ async def main() -> None:
 
     print()
 
-    # Get spot account state
-    spot_result = await api.info.spot_user_state()
+    # Spot account state
     if spot_result.is_ok():
         spot_state = spot_result.unwrap()
 
@@ -67,26 +82,23 @@ async def main() -> None:
             print("  Balances:")
             for balance in balances:
                 coin = balance.get("coin", "Unknown")
-                total = balance.get("total", "0")
-                hold = balance.get("hold", "0")
-                available = Decimal(total) - Decimal(hold)
-
-                if Decimal(total) > 0:
-                    print(f"    {coin}: {total} total, {available} available")
-
-                    # Calculate USD value if possible
-                    if coin == "USDC":
-                        total_usd_value += Decimal(total)
-                    else:
-                        # Try to get mid price for conversion
-                        mids_result = await api.info.all_mids()
-                        if mids_result.is_ok():
-                            mids = mids_result.unwrap()
-                            if coin in mids:
-                                coin_price = Decimal(mids[coin])
-                                usd_value = Decimal(total) * coin_price
-                                total_usd_value += usd_value
-                                print(f"      (≈${usd_value:.2f} @ ${coin_price})")
+                raw_total = balance.get("total", "0")
+                # Parse each amount once and reuse it for all calculations below
+                total = Decimal(raw_total)
+                if total <= 0:
+                    continue
+
+                available = total - Decimal(balance.get("hold", "0"))
+                print(f"    {coin}: {raw_total} total, {available} available")
+
+                # Calculate USD value if possible
+                if coin == "USDC":
+                    total_usd_value += total
+                elif coin in mids:
+                    coin_price = Decimal(mids[coin])
+                    usd_value = total * coin_price
+                    total_usd_value += usd_value
+                    print(f"      (≈${usd_value:.2f} @ ${coin_price})")
 
             print(f"  Total USD Value: ≈${total_usd_value:.2f}")
         else:
@@ -96,8 +108,7 @@ async def main() -> None:
 
     print()
 
-    # Get open orders
-    orders_result = await api.info.user_open_orders()
+    # Open orders
     if orders_result.is_ok():
         orders = orders_result.unwrap()
 
@@ -118,8 +129,7 @@ async def main() -> None:
 
     print()
 
-    # Get recent fills
-    fills_result = await api.info.user_fills()
+    # Recent fills
     if fills_result.is_ok():
         fills = fills_result.unwrap()
 
@@ -140,6 +150,4 @@ async def main() -> None:
 
 
 if __name__ == "__main__":
-    import asyncio
-
     asyncio.run(main())
@@ -1,12 +1,40 @@
+from __future__ import annotations
+
+import asyncio
 import os
+from typing import Any
 
 from hl import TESTNET, Account, Api
+from hl.types import L2Level
 
 # Credentials also be e.g. loaded from a file instead
 address = os.environ["HL_ADDRESS"]
 secret_key = os.environ["HL_SECRET_KEY"]
 
 
+async def get_batch(queue: asyncio.Queue[Any], max_n: int) -> list[Any]:
+    """Wait for a message, then drain buffered ones for up to `max_n` in total."""
+    batch = [await queue.get()]
+    while len(batch) < max_n and not queue.empty():
+        batch.append(queue.get_nowait())
+    return batch
+
+
+def side_depth(levels: list[L2Level]) -> tuple[float, float]:
+    """Get the total size and the size-weighted average price of one book side."""
+    total = sum(float(level["sz"]) for level in levels)
+    notional = sum(float(level["px"]) * float(level["sz"]) for level in levels)
+    return total, notional / total if total else 0.0
+
+
+def format_side(levels: list[L2Level]) -> str:
+    """Format the best level and the depth of one book side, which may be empty."""
+    if not levels:
+        return "-"
+    total, vwap = side_depth(levels)
+    return f"{levels[0]['sz']} @ {levels[0]['px']} ({total:g} total, vwap {vwap:g})"
+
+
 async def main() -> None:
     account = Account(address=address, secret_key=secret_key)
     # Initialize the API client with your wallet credentials
@@ -19,10 +47,17 @@ async def main() -> None:
         # Subscribe to the L2 book for BTC
         sub_id, queue = await api.ws.subscriptions.l2_book(asset="BTC")
 
-        # Process the next 10 messages
-        for _ in range(10):
-            msg = await queue.get()
-            print(msg)
+        # Process the next 10 messages, handling any burst of buffered updates
+        # together rather than awaiting the queue once per message
+        received = 0
+        while received < 10:
+            msgs = await get_batch(queue, 10 - received)
+            for msg in msgs:
+                bids, asks = msg["data"]["levels"]
+                print(
+                    f"{msg['data']['coin']}: {format_side(bids)} / {format_side(asks)}"
+                )
+            received += len(msgs)
 
         # If the websocket connection remains in use, remember to unsubscribe
         # Unsubscribe so the queue can be removed for no longer being active
@@ -32,6 +67,4 @@ async def main() -> None:
 
 
 if __name__ == "__main__":
-    import asyncio
-
     asyncio.run(main())
@@ -9,7 +9,7 @@ from eth_account.signers.local import LocalAccount
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class Account:
     """Lightweight authentication credentials for Hyperliquid API.
 
@@ -63,18 +63,27 @@ class Api:
 
     @classmethod
     async def create(
-        cls, *, account: Account | None = None, network: Network = MAINNET
+        cls,
+        *,
+        account: Account | None = None,
+        network: Network = MAINNET,
+        mids_ttl: float = 0.0,
     ) -> "Api":
         """Create an Api instance.
 
         Args:
             account (Account): The account to use for authentication.
             network (Network): The network to use. Defaults to MAINNET.
+            mids_ttl (float): Seconds for which `info.all_mids` responses are reused. Defaults to 0.0 (no caching).
 
         Returns:
             (hl.Api): The Api instance.
         """
-        info = Info(transport=HttpTransport(network, "info"), account=account)
+        info = Info(
+            transport=HttpTransport(network, "info"),
+            account=account,
+            mids_ttl=mids_ttl,
+        )
         universe = await info.get_universe()
         exchange = Exchange(
             transport=HttpTransport(network, "exchange"),
@@ -1,3 +1,4 @@
+import time
 from datetime import date, datetime
 from typing import cast
 
@@ -106,6 +107,7 @@ class Info:
         transport: BaseTransport,
         universe: Universe | None = None,
         account: Account | None = None,
+        mids_ttl: float = 0.0,
     ):
         """Initialize the Info class with the given base URL.
 
@@ -113,10 +115,13 @@ class Info:
             transport (hl.transport.BaseTransport): The transport to use to make the requests.
             universe (hl.universe.Universe | None): The universe to use for the exchange.
             account (hl.account.Account | None): The default account to use for authenticated requests.
+            mids_ttl (float): Seconds for which a successful `all_mids` response is reused. Defaults to 0.0 (no caching).
         """
         self.transport = transport
         self.universe = universe or Universe({})
         self.account = account
+        self.mids_ttl = mids_ttl
+        self._mids_cache: dict[str | None, tuple[float, AllMidsResponse]] = {}
 
     def _resolve_address(
         self, address: str | None = None, account: Account | None = None
@@ -208,6 +213,10 @@ class Info:
 
         POST /info
 
+        If `mids_ttl` is set, successful responses are cached per dex and reused until
+        they are older than `mids_ttl` seconds. Every call returns its own copy of the
+        mids, so modifying a response doesn't affect the cache.
+
         Args:
             dex (str | None): The dex to retrieve mids for. Defaults to Hyperliquid Perp Dex.
 
@@ -220,12 +229,20 @@ class Info:
             >>> await api.info.all_mids()
             {'BTC': 110000.0, 'ETH': 1000.0, ...}
         """
+        if self.mids_ttl > 0 and dex in self._mids_cache:
+            cached_at, cached = self._mids_cache[dex]
+            if time.monotonic() - cached_at < self.mids_ttl:
+                return Result.ok(dict(cached))
+
         payload = AllMidsRequest(type="allMids")
         if dex is not None:
             payload["dex"] = dex
 
         response = await self.transport.invoke(payload, [RULE_EXPECT_DICT])
-        return cast(Result[AllMidsResponse, ApiError], response)
+        result = cast(Result[AllMidsResponse, ApiError], response)
+        if self.mids_ttl > 0 and result.is_ok():
+            self._mids_cache[dex] = (time.monotonic(), dict(result.unwrap()))
+        return result
 
     async def user_open_orders(
         self, *, address: str | None = None, account: Account | None = None
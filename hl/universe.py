@@ -1,4 +1,5 @@
-from decimal import ROUND_HALF_EVEN, Decimal
+from decimal import ROUND_HALF_EVEN, Context, Decimal
+from functools import lru_cache
 
 from hl.types import AssetInfo, Meta, SpotMeta
 
@@ -7,6 +8,18 @@ MAX_DECIMALS_PERPETUAL = 6
 MAX_DECIMALS_SPOT = 8
 
 
+@lru_cache(maxsize=None)
+def _sig_fig_context(rounding: str) -> Context:
+    """Return a context that rounds to NUM_SIGNIFICANT_FIGURES with *rounding*."""
+    return Context(prec=NUM_SIGNIFICANT_FIGURES, rounding=rounding)
+
+
+@lru_cache(maxsize=None)
+def _quantum(decimals: int) -> Decimal:
+    """Return the quantum for rounding to *decimals* decimals, which may be negative."""
+    return Decimal(1).scaleb(-decimals)
+
+
 class Universe:
     """The Universe class provides asset information and metadata for the exchange.
 
@@ -26,6 +39,8 @@ class Universe:
         ... btc_info = universe.id_to_info[btc_id]  # Get BTC's asset info
     """
 
+    __slots__ = ("name_to_id", "id_to_name", "id_to_info")
+
     name_to_id: dict[str, int]
     """Mapping from asset names (e.g. "BTC", "ETH") to their numeric asset IDs."""
 
@@ -146,7 +161,14 @@ class Universe:
         Returns:
             decimal.Decimal: The rounded price.
         """
-        info = self.id_to_info[self.to_asset_id(asset)]
+        asset_id = self.to_asset_id(asset)
+        px_decimals = self.id_to_info[asset_id]["pxDecimals"]
+
+        # Infinities and quiet NaNs can't be rounded, so return them as they are.
+        # Signaling NaNs still raise InvalidOperation below.
+        if not price.is_finite() and not price.is_snan():
+            return price
+
         price = price.normalize()
 
         # Integers already satisfy both rules
@@ -155,10 +177,14 @@ class Universe:
 
         # How many decimals does each rule allow?
         sigfig_exp = price.adjusted() - (NUM_SIGNIFICANT_FIGURES - 1)
-        tick_exp = max(sigfig_exp, -info["pxDecimals"])  # “larger” tick dominates
+        if sigfig_exp > -px_decimals:  # “larger” tick dominates
+            # Rounding to the significant figures is a single context operation
+            rounded = _sig_fig_context(rounding).plus(price)
+        else:
+            rounded = price.quantize(_quantum(px_decimals), rounding)
 
-        # Round and strip trailing zeros
-        return price.quantize(Decimal(f"1e{tick_exp}"), rounding).normalize()
+        # Strip trailing zeros
+        return rounded.normalize()
 
     def round_size(
         self,
@@ -179,4 +205,4 @@ class Universe:
             decimal.Decimal: The rounded size.
         """
         size_decimals = self.id_to_info[self.to_asset_id(asset)]["szDecimals"]
-        return size.quantize(Decimal(f"1e-{size_decimals}"), rounding=rounding)
+        return size.quantize(_quantum(size_decimals), rounding=rounding)
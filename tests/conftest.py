@@ -1,5 +1,6 @@
 import os
 from contextlib import _GeneratorContextManager, contextmanager
+from types import SimpleNamespace
 from typing import Any, Callable, Generator, Protocol, TypeAlias
 from unittest.mock import patch
 
@@ -47,30 +48,18 @@ def replace_values() -> ReplaceValues:
     return _replace_values
 
 
-# Patch the weakref.finalize to prevent "Event loop is closed" errors
 @pytest.fixture(scope="session", autouse=True)
 def patch_httpx_cleanup() -> Generator[None, None, None]:
-    """Patch httpx client cleanup to prevent 'Event loop is closed' errors."""
-    # Keep a reference to the original finalize function
-    import weakref
+    """Skip the garbage-collection cleanup that HttpTransport registers.
 
-    original_finalize = weakref.finalize
-
-    # Replace the weakref.finalize with a no-op function for httpx clients
-    with patch("weakref.finalize") as mock_finalize:
-        # When finalize is called for httpx cleanup, return a no-op callback
-        def side_effect(*args: Any, **kwargs: Any) -> Any:
-            # Check if this is a call to finalize an httpx client
-            if args and hasattr(args[0], "aclose"):
-                # Return a mock finalizer that does nothing
-                class MockFinalizer:
-                    def detach(self) -> None:
-                        return None
+    Test transports outlive their function-scoped event loops, so the finalizer can
+    only fail with "Event loop is closed" or warn about leaking the client. Only the
+    `weakref` reference in `hl.transport` is replaced; finalizers registered by any
+    other module are left untouched.
+    """
+    with patch("hl.transport.weakref", SimpleNamespace(finalize=_noop_finalize)):
+        yield
 
-                return MockFinalizer()
-            # Otherwise, call the real finalize function
-            return original_finalize(*args, **kwargs)
 
-        # Set our side effect
-        mock_finalize.side_effect = side_effect
-        yield
+def _noop_finalize(*args: Any, **kwargs: Any) -> None:
+    return None
@@ -1,7 +1,13 @@
+import asyncio
 import importlib
 import inspect
 import json
+import os
+import sys
+import weakref
+from collections import deque
 from pathlib import Path
+from types import FrameType
 from typing import Any, Callable, Optional
 
 from hl import BaseTransport
@@ -11,6 +17,28 @@ from hl.types import Network
 from hl.validator import Rule
 from .value_replacer_mixin import ValueReplacerMixin
 
+# Fixture names resolved for pytest nodes, so repeated start() calls within the same
+# test skip rebuilding the name. Weak keys let finished test items be collected.
+_NODE_FIXTURE_NAMES: "weakref.WeakKeyDictionary[Any, str]" = weakref.WeakKeyDictionary()
+
+# Fixture directories already created by this process
+_CREATED_FIXTURE_DIRS: set[Path] = set()
+
+# Error classes resolved from their import paths during replay, and the constructor
+# parameter names of error classes seen during capture
+_ERROR_CLASS_CACHE: dict[str, Any] = {}
+_ERROR_PARAM_NAMES: dict[type[ApiError], tuple[str, ...]] = {}
+
+
+def _error_param_names(error_class: type[ApiError]) -> tuple[str, ...]:
+    """Get the constructor parameter names of an error class, excluding self."""
+    param_names = _ERROR_PARAM_NAMES.get(error_class)
+    if param_names is None:
+        sig = inspect.signature(error_class.__init__)
+        param_names = tuple(name for name in sig.parameters if name != "self")
+        _ERROR_PARAM_NAMES[error_class] = param_names
+    return param_names
+
 
 class MockHttpTransportError(Exception):
     """Exception raised when MockHttpTransport is used incorrectly."""
@@ -52,7 +80,9 @@ class MockHttpTransport(BaseTransport, ValueReplacerMixin):
     """
 
     def __init__(
-        self, wrapped_transport: BaseTransport, fixture_dir: str = "tests/fixtures/http"
+        self,
+        wrapped_transport: BaseTransport,
+        fixture_dir: str = "tests/fixtures/http",
     ):
         """Initialize the mock transport.
 
@@ -66,7 +96,9 @@ class MockHttpTransport(BaseTransport, ValueReplacerMixin):
         ValueReplacerMixin.__init__(self)
 
         self.fixture_dir = Path(fixture_dir)
-        self.fixture_dir.mkdir(parents=True, exist_ok=True)
+        if self.fixture_dir not in _CREATED_FIXTURE_DIRS:
+            self.fixture_dir.mkdir(parents=True, exist_ok=True)
+            _CREATED_FIXTURE_DIRS.add(self.fixture_dir)
 
         # State for current capture session
         self._is_started = False
@@ -76,7 +108,11 @@ class MockHttpTransport(BaseTransport, ValueReplacerMixin):
         # State for replay mode
         self._is_replay_mode = False
         self._fixture_interactions: list[dict[str, Any]] = []
-        self._current_interaction_index = 0
+        # Pending (interaction, normalized expected payload, result) entries, consumed
+        # in order
+        self._replay_queue: deque[tuple[dict[str, Any], Any, Result[Any, ApiError]]] = (
+            deque()
+        )
         self._invoke_count = 0
 
         # State for value replacements is handled by the mixin
@@ -97,18 +133,13 @@ class MockHttpTransport(BaseTransport, ValueReplacerMixin):
         import_path = f"{error_class.__module__}.{error_class.__qualname__}"
 
         # Extract constructor arguments from the error instance
-        # We need to map the error's attributes back to constructor parameters
-        kwargs = {}
-
-        # Get the constructor signature to know what parameters to extract
-        sig = inspect.signature(error_class.__init__)
-        for param_name, param in sig.parameters.items():
-            if param_name == "self":
-                continue
-
-            # Try to get the attribute from the error instance
-            if hasattr(error, param_name):
-                kwargs[param_name] = getattr(error, param_name)
+        # We need to map the error's attributes back to constructor parameters,
+        # using the cached constructor signature to know what parameters to extract
+        kwargs = {
+            param_name: getattr(error, param_name)
+            for param_name in _error_param_names(error_class)
+            if hasattr(error, param_name)
+        }
 
         return {"import_path": import_path, "kwargs": kwargs}
 
@@ -117,12 +148,15 @@ class MockHttpTransport(BaseTransport, ValueReplacerMixin):
         import_path = error_dict["import_path"]
         kwargs = error_dict["kwargs"]
 
-        # Split the import path to get module and class name
-        module_path, class_name = import_path.rsplit(".", 1)
+        error_class = _ERROR_CLASS_CACHE.get(import_path)
+        if error_class is None:
+            # Split the import path to get module and class name
+            module_path, class_name = import_path.rsplit(".", 1)
 
-        # Import the module and get the class
-        module = importlib.import_module(module_path)
-        error_class = getattr(module, class_name)
+            # Import the module and get the class
+            module = importlib.import_module(module_path)
+            error_class = getattr(module, class_name)
+            _ERROR_CLASS_CACHE[import_path] = error_class
 
         # Create the error instance with the stored kwargs
         return error_class(**kwargs)  # type: ignore
@@ -147,6 +181,31 @@ class MockHttpTransport(BaseTransport, ValueReplacerMixin):
 
         The fixture name is automatically inferred from the callstack.
         """
+        fixture_path = self._begin_start()
+        interactions = self._load_fixture_sync(fixture_path)
+        if interactions is not None:
+            self._setup_replay_mode(fixture_path, interactions)
+        else:
+            self._setup_capture_mode()
+
+        self._is_started = True
+
+    async def astart(self) -> None:
+        """Start capturing/replaying requests without blocking the event loop.
+
+        Same as start(), but the fixture file is read in a worker thread.
+        """
+        fixture_path = self._begin_start()
+        interactions = await asyncio.to_thread(self._load_fixture_sync, fixture_path)
+        if interactions is not None:
+            self._setup_replay_mode(fixture_path, interactions)
+        else:
+            self._setup_capture_mode()
+
+        self._is_started = True
+
+    def _begin_start(self) -> Path:
+        """Infer the fixture name for a new session and return its fixture path."""
         if self._is_started:
             raise MockHttpTransportError("MockHttpTransport is already started")
 
@@ -154,29 +213,54 @@ class MockHttpTransport(BaseTransport, ValueReplacerMixin):
         if not self._current_fixture_name:
             raise MockHttpTransportError("Could not infer fixture name from callstack")
 
-        # Check if we're in replay mode (fixture exists)
-        fixture_path = self._get_fixture_path(self._current_fixture_name)
-        if fixture_path.exists():
-            self._setup_replay_mode(fixture_path)
-        else:
-            self._setup_capture_mode()
+        return self._get_fixture_path(self._current_fixture_name)
 
-        self._is_started = True
+    def _load_fixture_sync(self, fixture_path: Path) -> Optional[list[dict[str, Any]]]:
+        """Load the interactions of the current fixture.
+
+        Every load parses its own copy of the fixture, since tests may modify the
+        responses they are handed.
+
+        Returns:
+            The fixture interactions, or None if the fixture doesn't exist yet
+        """
+        try:
+            raw = fixture_path.read_bytes()
+        except FileNotFoundError:
+            return None
 
-    def _setup_replay_mode(self, fixture_path: Path) -> None:
-        """Setup replay mode by loading fixture interactions."""
         try:
-            with open(fixture_path, "r") as f:
-                fixture_data = json.load(f)
+            fixture_data = json.loads(raw)
+            interactions: list[dict[str, Any]] = fixture_data.get("interactions", [])
+            return interactions
 
-            self._fixture_interactions = fixture_data.get("interactions", [])
-            self._is_replay_mode = True
-            self._current_interaction_index = 0
-            self._invoke_count = 0
+        except (json.JSONDecodeError, KeyError) as e:
+            raise MockHttpTransportError(f"Failed to load fixture {fixture_path}: {e}")
 
-        except (json.JSONDecodeError, KeyError, FileNotFoundError) as e:
+    def _setup_replay_mode(
+        self, fixture_path: Path, interactions: list[dict[str, Any]]
+    ) -> None:
+        """Setup replay mode with the loaded fixture interactions."""
+        # Normalize the expected payloads and deserialize the results once per load,
+        # so replaying an invoke is only a comparison; replacements are only
+        # registered after start(), so they are still applied per invoke
+        try:
+            replay_queue = deque(
+                (
+                    interaction,
+                    self._normalize_payload(interaction.get("normalized_payload")),
+                    self._deserialize_result(interaction["result"]),
+                )
+                for interaction in interactions
+            )
+        except (KeyError, TypeError, ValueError, AttributeError, ImportError) as e:
             raise MockHttpTransportError(f"Failed to load fixture {fixture_path}: {e}")
 
+        self._fixture_interactions = interactions
+        self._replay_queue = replay_queue
+        self._is_replay_mode = True
+        self._invoke_count = 0
+
     def _setup_capture_mode(self) -> None:
         """Setup capture mode for new fixtures."""
         self._captured_interactions = []
@@ -188,9 +272,29 @@ class MockHttpTransport(BaseTransport, ValueReplacerMixin):
 
         In replay mode, validates that the expected number of invokes occurred.
         """
+        pending = self._end_session()
+        if pending is not None:
+            self._dump_fixture_sync(*pending)
+
+    async def astop(self) -> None:
+        """Stop capturing/replaying without blocking the event loop.
+
+        Same as stop(), but the fixture file is written in a worker thread.
+        """
+        pending = self._end_session()
+        if pending is not None:
+            await asyncio.to_thread(self._dump_fixture_sync, *pending)
+
+    def _end_session(self) -> Optional[tuple[Path, dict[str, Any]]]:
+        """Validate and reset the current session.
+
+        Returns:
+            The fixture path and data to save if interactions were captured, else None
+        """
         if not self._is_started:
             raise MockHttpTransportError("MockHttpTransport is not started")
 
+        pending = None
         if self._is_replay_mode:
             # Validate that we made the expected number of invokes
             expected_count = len(self._fixture_interactions)
@@ -203,16 +307,11 @@ class MockHttpTransport(BaseTransport, ValueReplacerMixin):
             # Save fixtures if we have any captured interactions
             if self._captured_interactions and self._current_fixture_name:
                 fixture_path = self._get_fixture_path(self._current_fixture_name)
-
-                # Only save if fixture doesn't exist yet
-                if not fixture_path.exists():
-                    fixture_data = {
-                        "fixture_name": self._current_fixture_name,
-                        "interactions": self._captured_interactions,
-                    }
-
-                    with open(fixture_path, "w") as f:
-                        json.dump(fixture_data, f, indent=2)
+                fixture_data = {
+                    "fixture_name": self._current_fixture_name,
+                    "interactions": self._captured_interactions,
+                }
+                pending = (fixture_path, fixture_data)
 
         # Reset state
         self._is_started = False
@@ -220,53 +319,87 @@ class MockHttpTransport(BaseTransport, ValueReplacerMixin):
         self._captured_interactions = []
         self._is_replay_mode = False
         self._fixture_interactions = []
-        self._current_interaction_index = 0
+        self._replay_queue = deque()
         self._invoke_count = 0
 
+        return pending
+
+    def _dump_fixture_sync(
+        self, fixture_path: Path, fixture_data: dict[str, Any]
+    ) -> None:
+        """Save captured fixture data unless the fixture already exists."""
+        if fixture_path.exists():
+            return
+
+        # Write to a temporary file first so an interrupted run never leaves a
+        # truncated fixture behind to be replayed
+        tmp_path = fixture_path.with_suffix(".json.tmp")
+        tmp_path.write_bytes(json.dumps(fixture_data, indent=2).encode())
+        os.replace(tmp_path, fixture_path)
+
     def _get_fixture_name_from_callstack(self) -> Optional[str]:
         """Get the fixture name by inspecting the callstack for the test function.
 
         Returns:
             Fixture name in format {module_name}-{test_function_name} or None if not found
         """
-        # Get the current call stack
-        stack = inspect.stack()
-
-        # Look for pytest's request object or test node information in the stack
-        for frame_info in stack:
-            frame = frame_info.frame
-
-            # Check local variables for pytest request object
-            if "request" in frame.f_locals:
-                request = frame.f_locals["request"]
-                if hasattr(request, "node") and hasattr(request.node, "name"):
-                    test_name = request.node.name
-                    if test_name.startswith("test_"):
-                        # Get module name from the request
-                        if hasattr(request.node, "module"):
-                            module_name = request.node.module.__name__
+        # Walk the frames directly; inspect.stack() would also resolve source
+        # lines for every frame, which is far more expensive
+        frame: Optional[FrameType] = sys._getframe(1)
+        try:
+            # Look for pytest's request object or test node information in the stack
+            while frame is not None:
+                f_locals = frame.f_locals
+
+                # Check local variables for pytest request object
+                if "request" in f_locals:
+                    request = f_locals["request"]
+                    if hasattr(request, "node") and hasattr(request.node, "name"):
+                        cached = _NODE_FIXTURE_NAMES.get(request.node)
+                        if cached is not None:
+                            return cached
+                        test_name = request.node.name
+                        if test_name.startswith("test_"):
+                            # Get module name from the request
+                            if hasattr(request.node, "module"):
+                                module_name = request.node.module.__name__
+                                module_basename = module_name.split(".")[-1]
+                                fixture_name = f"{module_basename}-{test_name}"
+                                _NODE_FIXTURE_NAMES[request.node] = fixture_name
+                                return fixture_name
+
+                # Also check for test items in locals
+                if "item" in f_locals:
+                    item = f_locals["item"]
+                    if hasattr(item, "name") and item.name.startswith("test_"):
+                        cached = _NODE_FIXTURE_NAMES.get(item)
+                        if cached is not None:
+                            return cached
+                        if hasattr(item, "module"):
+                            module_name = item.module.__name__
                             module_basename = module_name.split(".")[-1]
-                            return f"{module_basename}-{test_name}"
-
-            # Also check for test items in locals
-            if "item" in frame.f_locals:
-                item = frame.f_locals["item"]
-                if hasattr(item, "name") and item.name.startswith("test_"):
-                    if hasattr(item, "module"):
-                        module_name = item.module.__name__
-                        module_basename = module_name.split(".")[-1]
-                        return f"{module_basename}-{item.name}"
-
-        # Fallback: look for direct test function calls (original approach)
-        for frame_info in stack:
-            func_name = frame_info.function
-            module_name = frame_info.frame.f_globals.get("__name__", "")
-
-            # Check if this is a test function
-            if func_name.startswith("test_") and module_name:
-                # Extract just the module name (e.g., 'test_info' from 'tests.test_info')
-                module_basename = module_name.split(".")[-1]
-                return f"{module_basename}-{func_name}"
+                            fixture_name = f"{module_basename}-{item.name}"
+                            _NODE_FIXTURE_NAMES[item] = fixture_name
+                            return fixture_name
+
+                frame = frame.f_back
+
+            # Fallback: look for direct test function calls (original approach)
+            frame = sys._getframe(1)
+            while frame is not None:
+                func_name = frame.f_code.co_name
+                module_name = frame.f_globals.get("__name__", "")
+
+                # Check if this is a test function
+                if func_name.startswith("test_") and module_name:
+                    # Extract just the module name (e.g., 'test_info' from 'tests.test_info')
+                    module_basename = module_name.split(".")[-1]
+                    return f"{module_basename}-{func_name}"
+
+                frame = frame.f_back
+        finally:
+            # Break the reference cycle between this frame and the walked frames
+            del frame
 
         return None
 
@@ -309,35 +442,35 @@ class MockHttpTransport(BaseTransport, ValueReplacerMixin):
 
     def _handle_replay_invoke(self, payload: Any) -> Result[Any, ApiError]:
         """Handle invoke in replay mode with strict sequential validation."""
-        if self._current_interaction_index >= len(self._fixture_interactions):
+        try:
+            expected_interaction, expected_final, result = self._replay_queue.popleft()
+        except IndexError:
             raise MockHttpTransportError(
                 f"Too many invokes for fixture {self._current_fixture_name}. "
                 f"Expected {len(self._fixture_interactions)} but this is invoke #{self._invoke_count}"
-            )
-
-        expected_interaction = self._fixture_interactions[
-            self._current_interaction_index
-        ]
-
-        # Apply replacements to the incoming payload before comparison
-        # This ensures the payload is normalized the same way as when it was captured
-        replaced_payload = self._apply_replacements(payload, self._request_replacements)
-        normalized_payload = self._normalize_payload(replaced_payload)
+            ) from None
 
-        # Get the expected normalized payload from the fixture
-        expected_normalized = expected_interaction.get("normalized_payload")
-        if expected_normalized is None:
+        # The expected normalized payload was precomputed when loading the fixture
+        if expected_final is None:
             raise MockHttpTransportError(
                 f"Fixture {self._current_fixture_name} is missing 'normalized_payload' field. "
                 f"Please regenerate the fixture."
             )
 
-        # Apply the same replacements to the expected fixture data for fair comparison
-        # This allows replace_values to work correctly by normalizing both sides
-        expected_with_replacements = self._apply_replacements(
-            expected_normalized, self._request_replacements
-        )
-        expected_final = self._normalize_payload(expected_with_replacements)
+        request_replacements = self._request_replacements
+        if request_replacements:
+            # Apply replacements to the incoming payload before comparison
+            # This ensures the payload is normalized the same way as when it was captured
+            payload = self._apply_replacements(payload, request_replacements)
+
+            # Apply the same replacements to the expected fixture data for fair comparison
+            # This allows replace_values to work correctly by normalizing both sides
+            expected_with_replacements = self._apply_replacements(
+                expected_interaction["normalized_payload"], request_replacements
+            )
+            expected_final = self._normalize_payload(expected_with_replacements)
+
+        normalized_payload = self._normalize_payload(payload)
 
         if normalized_payload != expected_final:
             raise MockHttpTransportError(
@@ -345,31 +478,38 @@ class MockHttpTransport(BaseTransport, ValueReplacerMixin):
                 f"Expected: {expected_final}, Got: {normalized_payload}"
             )
 
-        result_data = expected_interaction["result"]
-        result = self._deserialize_result(result_data)
-        if result.is_ok():
+        if self._response_replacements and result.is_ok():
             result = Result.ok(
                 self._apply_replacements(result.unwrap(), self._response_replacements)
             )
 
-        self._current_interaction_index += 1
         return result
 
     async def _handle_capture_invoke(
         self, payload: Any, validators: list[Rule] | None = None
     ) -> Result[Any, ApiError]:
         """Handle invoke in capture mode."""
-        # Make real API call - this now returns Result[Any, ApiError]
-        result = await self.wrapped_transport.invoke(payload, validators)
-
-        # Apply replacements to payload
+        # Record the interaction before the real call, so concurrent invokes are
+        # captured in the order they were made, which is the order replay expects
         captured_payload = self._apply_replacements(payload, self._request_replacements)
-        captured_normalized_payload = self._normalize_payload(captured_payload)
+        interaction: dict[str, Any] = {
+            "normalized_payload": self._normalize_payload(captured_payload)
+        }
+        self._captured_interactions.append(interaction)
+        response_replacements = self._response_replacements
+
+        # Make real API call - this now returns Result[Any, ApiError]
+        try:
+            result = await self.wrapped_transport.invoke(payload, validators)
+        except BaseException:
+            # Don't leave an interaction without a result in the fixture
+            self._captured_interactions.remove(interaction)
+            raise
 
         # Apply replacements to result before serializing
         if result.is_ok():
             captured_response = self._apply_replacements(
-                result.unwrap(), self._response_replacements
+                result.unwrap(), response_replacements
             )
             captured_result: Result[Any, ApiError] = Result.ok(captured_response)
         else:
@@ -377,15 +517,8 @@ class MockHttpTransport(BaseTransport, ValueReplacerMixin):
             # but we could if needed
             captured_result = result
 
-        # Serialize the result
-        serialized_result = self._serialize_result(captured_result)
-
-        # Capture the interaction
-        interaction = {
-            "normalized_payload": captured_normalized_payload,
-            "result": serialized_result,
-        }
-        self._captured_interactions.append(interaction)
+        # Serialize the result into the reserved interaction
+        interaction["result"] = self._serialize_result(captured_result)
 
         return result
 
@@ -397,16 +530,13 @@ class MockHttpTransport(BaseTransport, ValueReplacerMixin):
 
     def _normalize_payload(self, payload: Any) -> Any:
         """Normalize payload for matching by removing or standardizing dynamic fields."""
-        if not isinstance(payload, dict):
+        if not isinstance(payload, dict) or "action" not in payload:
+            # For info endpoints, use the full payload as it's typically static
             return payload
 
         # For exchange endpoints, only match on the action, ignore dynamic fields
-        if "action" in payload:
-            normalized = {"action": payload.get("action")}
-            # Keep vaultAddress as it's part of the logical request
-            if "vaultAddress" in payload:
-                normalized["vaultAddress"] = payload["vaultAddress"]
-            return normalized
-        else:
-            # For info endpoints, use the full payload as it's typically static
-            return payload
+        normalized = {"action": payload["action"]}
+        # Keep vaultAddress as it's part of the logical request, even when None
+        if "vaultAddress" in payload:
+            normalized["vaultAddress"] = payload["vaultAddress"]
+        return normalized
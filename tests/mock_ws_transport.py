@@ -2,9 +2,12 @@ import asyncio
 import importlib
 import inspect
 import json
+import sys
 import time
+from array import array
 from contextlib import asynccontextmanager
 from pathlib import Path
+from types import FrameType
 from typing import Any, AsyncGenerator, Optional
 
 from hl.errors import ApiError
@@ -15,6 +18,41 @@ from hl.ws_transport import WsTransport
 from .value_replacer_mixin import ValueReplacerMixin
 
 
+def _freeze(obj: Any) -> Any:
+    """Convert nested dicts and lists into hashable tuples, independent of key order.
+
+    Frozen values compare and hash like the original values compare with ==, so they
+    can be used directly as lookup keys.
+    """
+    if isinstance(obj, dict):
+        return tuple(sorted((key, _freeze(value)) for key, value in obj.items()))
+    if isinstance(obj, list):
+        return tuple(_freeze(item) for item in obj)
+    return obj
+
+
+# Marks a key absent from a payload, since None is a meaningful recorded value
+_MISSING = object()
+
+# Fixture directories already created by an instance in this process
+_CREATED_FIXTURE_DIRS: set[Path] = set()
+
+# Error classes resolved from their import paths during replay, and the constructor
+# parameter names of error classes seen during capture
+_ERROR_CLASS_CACHE: dict[str, Any] = {}
+_ERROR_PARAM_NAMES: dict[type[ApiError], tuple[str, ...]] = {}
+
+
+def _error_param_names(error_class: type[ApiError]) -> tuple[str, ...]:
+    """Get the constructor parameter names of an error class, excluding self."""
+    param_names = _ERROR_PARAM_NAMES.get(error_class)
+    if param_names is None:
+        sig = inspect.signature(error_class.__init__)
+        param_names = tuple(name for name in sig.parameters if name != "self")
+        _ERROR_PARAM_NAMES[error_class] = param_names
+    return param_names
+
+
 class MockWsTransportError(Exception):
     """Exception raised when MockWsTransport is used incorrectly."""
 
@@ -91,6 +129,7 @@ class MockWsTransport(WsTransport, ValueReplacerMixin):
         fixture_dir: str = "tests/fixtures/ws",
         capture_duration: float = 10.0,
         replay_with_timing: bool = False,
+        capture_max_messages: Optional[int] = None,
     ):
         """Initialize the mock WebSocket transport.
 
@@ -100,6 +139,9 @@ class MockWsTransport(WsTransport, ValueReplacerMixin):
             capture_duration: How long to capture streaming messages in seconds
             replay_with_timing: If True, replay messages with original timing intervals.
                                If False, send all messages immediately.
+            capture_max_messages: If set, only the first messages of each subscription,
+                                 up to this many, are saved to the fixture. Later
+                                 messages are still forwarded while capturing.
         """
         self.wrapped_transport = wrapped_transport
 
@@ -110,9 +152,14 @@ class MockWsTransport(WsTransport, ValueReplacerMixin):
         ValueReplacerMixin.__init__(self)
 
         self.fixture_dir = Path(fixture_dir)
-        self.fixture_dir.mkdir(parents=True, exist_ok=True)
+        if self.fixture_dir not in _CREATED_FIXTURE_DIRS:
+            self.fixture_dir.mkdir(parents=True, exist_ok=True)
+            _CREATED_FIXTURE_DIRS.add(self.fixture_dir)
+        # Fixture paths by fixture name, built on first use
+        self._fixture_paths: dict[str, Path] = {}
         self.capture_duration = capture_duration
         self.replay_with_timing = replay_with_timing
+        self.capture_max_messages = capture_max_messages
 
         # State for current capture session
         self._is_started = False
@@ -122,6 +169,16 @@ class MockWsTransport(WsTransport, ValueReplacerMixin):
         # State for replay mode
         self._is_replay_mode = False
         self._fixture_interactions: list[dict[str, Any]] = []
+        # Fixture interactions split by type once at load
+        self._invoke_interactions: list[dict[str, Any]] = []
+        self._subscribe_interactions: list[dict[str, Any]] = []
+        # Interactions keyed by the canonical key of their stored payload/subscription
+        self._invoke_index: dict[Any, dict[str, Any]] = {}
+        self._subscribe_index: dict[Any, dict[str, Any]] = {}
+        # Indexes built for the request replacements they were built with
+        self._prepared_indexes: Optional[
+            tuple[dict[str, Any], dict[Any, dict[str, Any]], dict[Any, dict[str, Any]]]
+        ] = None
         self._current_interaction_index = 0
         self._invoke_count = 0
 
@@ -149,18 +206,13 @@ class MockWsTransport(WsTransport, ValueReplacerMixin):
         import_path = f"{error_class.__module__}.{error_class.__qualname__}"
 
         # Extract constructor arguments from the error instance
-        # We need to map the error's attributes back to constructor parameters
-        kwargs = {}
-
-        # Get the constructor signature to know what parameters to extract
-        sig = inspect.signature(error_class.__init__)
-        for param_name, param in sig.parameters.items():
-            if param_name == "self":
-                continue
-
-            # Try to get the attribute from the error instance
-            if hasattr(error, param_name):
-                kwargs[param_name] = getattr(error, param_name)
+        # We need to map the error's attributes back to constructor parameters,
+        # using the cached constructor signature to know what parameters to extract
+        kwargs = {
+            param_name: getattr(error, param_name)
+            for param_name in _error_param_names(error_class)
+            if hasattr(error, param_name)
+        }
 
         return {"import_path": import_path, "kwargs": kwargs}
 
@@ -169,12 +221,15 @@ class MockWsTransport(WsTransport, ValueReplacerMixin):
         import_path = error_dict["import_path"]
         kwargs = error_dict["kwargs"]
 
-        # Split the import path to get module and class name
-        module_path, class_name = import_path.rsplit(".", 1)
+        error_class = _ERROR_CLASS_CACHE.get(import_path)
+        if error_class is None:
+            # Split the import path to get module and class name
+            module_path, class_name = import_path.rsplit(".", 1)
 
-        # Import the module and get the class
-        module = importlib.import_module(module_path)
-        error_class = getattr(module, class_name)
+            # Import the module and get the class
+            module = importlib.import_module(module_path)
+            error_class = getattr(module, class_name)
+            _ERROR_CLASS_CACHE[import_path] = error_class
 
         # Create the error instance with the stored kwargs
         return error_class(**kwargs)  # type: ignore
@@ -199,6 +254,35 @@ class MockWsTransport(WsTransport, ValueReplacerMixin):
 
         The fixture name is automatically inferred from the callstack.
         """
+        fixture_path = self._begin_start()
+
+        # Check if we're in replay mode (fixture exists)
+        fixture_data = self._load_fixture_sync(fixture_path)
+        if fixture_data is not None:
+            self._setup_replay_mode(fixture_path, fixture_data)
+        else:
+            self._setup_capture_mode()
+
+        self._is_started = True
+
+    async def astart(self) -> None:
+        """Start capturing/replaying requests without blocking the event loop.
+
+        Same as start(), but the fixture file is read and parsed in a worker thread.
+        """
+        fixture_path = self._begin_start()
+
+        # Check if we're in replay mode (fixture exists)
+        fixture_data = await asyncio.to_thread(self._load_fixture_sync, fixture_path)
+        if fixture_data is not None:
+            self._setup_replay_mode(fixture_path, fixture_data)
+        else:
+            self._setup_capture_mode()
+
+        self._is_started = True
+
+    def _begin_start(self) -> Path:
+        """Infer the fixture name for a new session and return its fixture path."""
         if self._is_started:
             raise MockWsTransportError("MockWsTransport is already started")
 
@@ -206,29 +290,97 @@ class MockWsTransport(WsTransport, ValueReplacerMixin):
         if not self._current_fixture_name:
             raise MockWsTransportError("Could not infer fixture name from callstack")
 
-        # Check if we're in replay mode (fixture exists)
-        fixture_path = self._get_fixture_path(self._current_fixture_name)
-        if fixture_path.exists():
-            self._setup_replay_mode(fixture_path)
-        else:
-            self._setup_capture_mode()
+        return self._get_fixture_path(self._current_fixture_name)
 
-        self._is_started = True
+    def _load_fixture_sync(self, fixture_path: Path) -> Optional[dict[str, Any]]:
+        """Read and parse a fixture file.
+
+        Returns:
+            The fixture data, or None if the fixture file does not exist
+        """
+        # Attempt the read directly instead of checking exists() first
+        try:
+            raw = fixture_path.read_bytes()
+        except FileNotFoundError:
+            return None
 
-    def _setup_replay_mode(self, fixture_path: Path) -> None:
-        """Setup replay mode by loading fixture interactions."""
         try:
-            with open(fixture_path, "r") as f:
-                fixture_data = json.load(f)
+            fixture_data: dict[str, Any] = json.loads(raw)
+            return fixture_data
 
-            self._fixture_interactions = fixture_data.get("interactions", [])
+        except json.JSONDecodeError as e:
+            raise MockWsTransportError(f"Failed to load fixture {fixture_path}: {e}")
+
+    def _setup_replay_mode(
+        self, fixture_path: Path, fixture_data: dict[str, Any]
+    ) -> None:
+        """Setup replay mode with the loaded fixture interactions."""
+        try:
+            interactions = fixture_data.get("interactions", [])
+            self._fixture_interactions = interactions
+            self._invoke_interactions = [
+                i for i in interactions if i.get("type") == "invoke"
+            ]
+            self._subscribe_interactions = [
+                i for i in interactions if i.get("type") == "subscribe"
+            ]
+            self._invoke_index, self._subscribe_index = self._build_replay_indexes({})
+            self._prepared_indexes = None
             self._is_replay_mode = True
             self._current_interaction_index = 0
             self._invoke_count = 0
 
-        except (json.JSONDecodeError, KeyError, FileNotFoundError) as e:
+        except KeyError as e:
             raise MockWsTransportError(f"Failed to load fixture {fixture_path}: {e}")
 
+    def _build_replay_indexes(
+        self, replacements: dict[str, Any]
+    ) -> tuple[dict[Any, dict[str, Any]], dict[Any, dict[str, Any]]]:
+        """Index the fixture interactions for constant-time lookup during replay.
+
+        The stored payloads and subscriptions are keyed after applying the given
+        request replacements. The first matching interaction wins, as in a scan.
+
+        Returns:
+            The invoke and subscribe interactions keyed by their canonical key
+        """
+        invoke_index: dict[Any, dict[str, Any]] = {}
+        subscribe_index: dict[Any, dict[str, Any]] = {}
+        for interaction in self._invoke_interactions:
+            payload = self._apply_replacements(
+                interaction["normalized_payload"], replacements
+            )
+            invoke_index.setdefault(self._canonical_key(payload), interaction)
+        for interaction in self._subscribe_interactions:
+            subscription = self._apply_replacements(
+                interaction.get("subscription"), replacements
+            )
+            subscribe_index.setdefault(self._canonical_key(subscription), interaction)
+        return invoke_index, subscribe_index
+
+    def _get_replay_indexes(
+        self,
+    ) -> tuple[dict[Any, dict[str, Any]], dict[Any, dict[str, Any]]]:
+        """Get the replay indexes for the currently active request replacements.
+
+        Replacements are only registered after start(), so indexes for them are built
+        on first use and reused until replace_values() installs a different mapping.
+        """
+        replacements = self._request_replacements
+        if not replacements:
+            return self._invoke_index, self._subscribe_index
+
+        prepared = self._prepared_indexes
+        if prepared is None or prepared[0] is not replacements:
+            invoke_index, subscribe_index = self._build_replay_indexes(replacements)
+            prepared = (replacements, invoke_index, subscribe_index)
+            self._prepared_indexes = prepared
+        return prepared[1], prepared[2]
+
+    def _canonical_key(self, obj: Any) -> Any:
+        """Get a hashable canonical key for an object, independent of key order."""
+        return _freeze(obj)
+
     def _setup_capture_mode(self) -> None:
         """Setup capture mode for new fixtures."""
         self._captured_interactions = []
@@ -240,41 +392,34 @@ class MockWsTransport(WsTransport, ValueReplacerMixin):
         if not self._is_started:
             raise MockWsTransportError("MockWsTransport is not started")
 
-        # Cancel and await any active capture tasks first
-        if self._capture_tasks:
-            for task in self._capture_tasks.values():
-                if not task.done():
-                    task.cancel()
+        # Only a real connection, used in capture mode, needs time to clean up
+        needs_cleanup = not self._is_replay_mode and bool(
+            self._capture_tasks or getattr(self.wrapped_transport, "_tasks", None)
+        )
 
-            # Wait for all tasks to complete cancellation
-            await asyncio.gather(*self._capture_tasks.values(), return_exceptions=True)
-            self._capture_tasks.clear()
+        # Cancel the capture and replay tasks, and the wrapped transport's internal
+        # tasks in capture mode, then wait for all of them together
+        tasks = [*self._capture_tasks.values(), *self._replay_tasks.values()]
+        wrapped_tasks = getattr(self.wrapped_transport, "_tasks", None)
+        if not self._is_replay_mode and wrapped_tasks:
+            tasks.extend(wrapped_tasks)
 
-        # Cancel and await any active replay tasks
-        if self._replay_tasks:
-            for task in self._replay_tasks.values():
+        if tasks:
+            for task in tasks:
                 if not task.done():
                     task.cancel()
 
             # Wait for all tasks to complete cancellation
-            await asyncio.gather(*self._replay_tasks.values(), return_exceptions=True)
-            self._replay_tasks.clear()
-
-        # Try to clean up wrapped transport's internal tasks if they exist
-        if not self._is_replay_mode and hasattr(self.wrapped_transport, "_tasks"):
-            for task in self.wrapped_transport._tasks:
-                if not task.done():
-                    task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
 
-            # Wait for wrapped transport tasks to complete
-            if self.wrapped_transport._tasks:
-                await asyncio.gather(
-                    *self.wrapped_transport._tasks, return_exceptions=True
-                )
-                self.wrapped_transport._tasks.clear()
+        self._capture_tasks.clear()
+        self._replay_tasks.clear()
+        if not self._is_replay_mode and wrapped_tasks:
+            wrapped_tasks.clear()
 
         # Give extra time for websockets library internal cleanup
-        await asyncio.sleep(0.5)
+        if needs_cleanup:
+            await asyncio.sleep(0.5)
 
         if self._is_replay_mode:
             # In replay mode, just validate we processed all expected interactions
@@ -294,8 +439,9 @@ class MockWsTransport(WsTransport, ValueReplacerMixin):
                         "interactions": self._captured_interactions,
                     }
 
-                    with open(fixture_path, "w") as f:
-                        json.dump(fixture_data, f, indent=2)
+                    # Write in a worker thread so the event loop isn't blocked
+                    data = json.dumps(fixture_data, indent=2).encode()
+                    await asyncio.to_thread(fixture_path.write_bytes, data)
 
         # Reset state
         self._is_started = False
@@ -303,6 +449,11 @@ class MockWsTransport(WsTransport, ValueReplacerMixin):
         self._captured_interactions = []
         self._is_replay_mode = False
         self._fixture_interactions = []
+        self._invoke_interactions = []
+        self._subscribe_interactions = []
+        self._invoke_index = {}
+        self._subscribe_index = {}
+        self._prepared_indexes = None
         self._current_interaction_index = 0
         self._invoke_count = 0
         self._active_subscriptions.clear()
@@ -312,44 +463,53 @@ class MockWsTransport(WsTransport, ValueReplacerMixin):
 
     def _get_fixture_name_from_callstack(self) -> Optional[str]:
         """Get the fixture name by inspecting the callstack for the test function."""
-        # Get the current call stack
-        stack = inspect.stack()
-
-        # Look for pytest's request object or test node information in the stack
-        for frame_info in stack:
-            frame = frame_info.frame
-
-            # Check local variables for pytest request object
-            if "request" in frame.f_locals:
-                request = frame.f_locals["request"]
-                if hasattr(request, "node") and hasattr(request.node, "name"):
-                    test_name = request.node.name
-                    if test_name.startswith("test_"):
-                        # Get module name from the request
-                        if hasattr(request.node, "module"):
-                            module_name = request.node.module.__name__
+        # Walk the frames directly; inspect.stack() would also resolve source
+        # lines for every frame, which is far more expensive
+        frame: Optional[FrameType] = sys._getframe(1)
+        try:
+            # Look for pytest's request object or test node information in the stack
+            while frame is not None:
+                f_locals = frame.f_locals
+
+                # Check local variables for pytest request object
+                if "request" in f_locals:
+                    request = f_locals["request"]
+                    if hasattr(request, "node") and hasattr(request.node, "name"):
+                        test_name = request.node.name
+                        if test_name.startswith("test_"):
+                            # Get module name from the request
+                            if hasattr(request.node, "module"):
+                                module_name = request.node.module.__name__
+                                module_basename = module_name.split(".")[-1]
+                                return f"{module_basename}-{test_name}"
+
+                # Also check for test items in locals
+                if "item" in f_locals:
+                    item = f_locals["item"]
+                    if hasattr(item, "name") and item.name.startswith("test_"):
+                        if hasattr(item, "module"):
+                            module_name = item.module.__name__
                             module_basename = module_name.split(".")[-1]
-                            return f"{module_basename}-{test_name}"
-
-            # Also check for test items in locals
-            if "item" in frame.f_locals:
-                item = frame.f_locals["item"]
-                if hasattr(item, "name") and item.name.startswith("test_"):
-                    if hasattr(item, "module"):
-                        module_name = item.module.__name__
-                        module_basename = module_name.split(".")[-1]
-                        return f"{module_basename}-{item.name}"
-
-        # Fallback: look for direct test function calls
-        for frame_info in stack:
-            func_name = frame_info.function
-            module_name = frame_info.frame.f_globals.get("__name__", "")
-
-            # Check if this is a test function
-            if func_name.startswith("test_") and module_name:
-                # Extract just the module name (e.g., 'test_info' from 'tests.test_info')
-                module_basename = module_name.split(".")[-1]
-                return f"{module_basename}-{func_name}"
+                            return f"{module_basename}-{item.name}"
+
+                frame = frame.f_back
+
+            # Fallback: look for direct test function calls
+            frame = sys._getframe(1)
+            while frame is not None:
+                func_name = frame.f_code.co_name
+                module_name = frame.f_globals.get("__name__", "")
+
+                # Check if this is a test function
+                if func_name.startswith("test_") and module_name:
+                    # Extract just the module name (e.g., 'test_info' from 'tests.test_info')
+                    module_basename = module_name.split(".")[-1]
+                    return f"{module_basename}-{func_name}"
+
+                frame = frame.f_back
+        finally:
+            # Break the reference cycle between this frame and the walked frames
+            del frame
 
         return None
 
@@ -379,27 +539,21 @@ class MockWsTransport(WsTransport, ValueReplacerMixin):
         normalized_payload = self._normalize_payload(replaced_payload)
 
         # Find matching interaction
-        for interaction in self._fixture_interactions:
-            if (
-                interaction["type"] == "invoke"
-                and self._apply_replacements(
-                    interaction["normalized_payload"], self._request_replacements
-                )
-                == normalized_payload
-            ):
-                result = self._deserialize_result(interaction["result"])
-                if result.is_ok():
-                    return Result.ok(
-                        self._apply_replacements(
-                            result.unwrap(), self._response_replacements
-                        )
-                    )
-                else:
-                    return result
-
-        raise MockWsTransportError(
-            f"No matching invoke interaction found for payload: {normalized_payload}"
-        )
+        invoke_index, _ = self._get_replay_indexes()
+        interaction = invoke_index.get(self._canonical_key(normalized_payload))
+
+        if interaction is None:
+            raise MockWsTransportError(
+                f"No matching invoke interaction found for payload: {normalized_payload}"
+            )
+
+        result = self._deserialize_result(interaction["result"])
+        if self._response_replacements and result.is_ok():
+            return Result.ok(
+                self._apply_replacements(result.unwrap(), self._response_replacements)
+            )
+        else:
+            return result
 
     async def _handle_capture_invoke(
         self, payload: Any, validators: list[Rule] | None
@@ -413,7 +567,7 @@ class MockWsTransport(WsTransport, ValueReplacerMixin):
         captured_normalized_payload = self._normalize_payload(captured_payload)
 
         # Apply replacements to result before serializing
-        if result.is_ok():
+        if self._response_replacements and result.is_ok():
             captured_response = self._apply_replacements(
                 result.unwrap(), self._response_replacements
             )
@@ -468,26 +622,17 @@ class MockWsTransport(WsTransport, ValueReplacerMixin):
         )
 
         # Find matching subscription interaction
-        subscription_id = None
-        messages = []
-
-        for interaction in self._fixture_interactions:
-            if (
-                interaction.get("type") == "subscribe"
-                and self._apply_replacements(
-                    interaction.get("subscription"), self._request_replacements
-                )
-                == replaced_subscription
-            ):
-                subscription_id = interaction.get("subscription_id", 1)
-                messages = interaction.get("messages", [])
-                break
-
-        if subscription_id is None:
+        _, subscribe_index = self._get_replay_indexes()
+        interaction = subscribe_index.get(self._canonical_key(replaced_subscription))
+
+        if interaction is None:
             raise MockWsTransportError(
                 f"No matching subscription found for: {replaced_subscription}"
             )
 
+        subscription_id = interaction.get("subscription_id", 1)
+        messages = interaction.get("messages", [])
+
         # Schedule message replay and track the task
         replay_task = asyncio.create_task(
             self._replay_messages(message_queue, messages)
@@ -502,9 +647,11 @@ class MockWsTransport(WsTransport, ValueReplacerMixin):
         message_queue: asyncio.Queue[Any] | None = None,
     ) -> tuple[int, asyncio.Queue[Any]]:
         """Handle subscribe in capture mode."""
-        # Make real subscription
+        # Make real subscription into a queue owned by the mock, so the capture task
+        # is the only producer for the queue handed to the caller
+        internal_queue: asyncio.Queue[Msg] = asyncio.Queue()
         subscription_id, real_queue = await self.wrapped_transport.subscribe(
-            subscription, message_queue
+            subscription, internal_queue
         )
 
         # Use the provided queue or create a new one if none provided
@@ -536,22 +683,31 @@ class MockWsTransport(WsTransport, ValueReplacerMixin):
         test_queue: asyncio.Queue[Any],
     ) -> None:
         """Capture messages from a subscription until cancelled."""
-        messages = []
-        start_time = time.time()
+        # Keep messages and their offsets in parallel columns while capturing and only
+        # build the per-message fixture records once capture ends
+        payloads: list[Any] = []
+        timestamps = array("d")
+        # Offsets are relative, so use the cheaper monotonic clock
+        start_time = time.monotonic()
+
+        # Bind the per-message calls once, outside the forwarding loop
+        get = real_queue.get
+        forward = test_queue.put_nowait
+        add_payload = payloads.append
+        add_timestamp = timestamps.append
+        monotonic = time.monotonic
+        limit = self.capture_max_messages
 
         try:
             while True:
                 try:
                     # Wait for message indefinitely until cancelled
-                    message = await real_queue.get()
-                    messages.append(
-                        {
-                            "message": message,
-                            "timestamp": time.time() - start_time,
-                        }
-                    )
+                    message = await get()
+                    if limit is None or len(payloads) < limit:
+                        add_payload(message)
+                        add_timestamp(monotonic() - start_time)
                     # Also put message in capture queue for any listening code
-                    test_queue.put_nowait(message)
+                    forward(message)
                 except asyncio.CancelledError:
                     break
         except asyncio.CancelledError:
@@ -564,7 +720,10 @@ class MockWsTransport(WsTransport, ValueReplacerMixin):
                     "type": "subscribe",
                     "subscription": subscription_data["subscription"],
                     "subscription_id": subscription_id,
-                    "messages": messages,
+                    "messages": [
+                        {"message": message, "timestamp": timestamp}
+                        for message, timestamp in zip(payloads, timestamps)
+                    ],
                     "capture_duration": self.capture_duration,
                     "timestamp": subscription_data["start_time"],
                 }
@@ -575,11 +734,19 @@ class MockWsTransport(WsTransport, ValueReplacerMixin):
     ) -> None:
         """Replay captured messages with their original timing or immediately."""
         try:
+            if not self.replay_with_timing:
+                # Nothing to wait for, so enqueue everything in one tight loop
+                put_nowait = message_queue.put_nowait
+                for msg_data in messages:
+                    put_nowait(msg_data["message"])
+                return
+
+            start_time = time.monotonic()
             for msg_data in messages:
-                if self.replay_with_timing:
-                    # Wait for the original timestamp
-                    await asyncio.sleep(msg_data["timestamp"])
-
+                # Wait until the original offset from the start of the subscription
+                delay = start_time + msg_data["timestamp"] - time.monotonic()
+                if delay > 0:
+                    await asyncio.sleep(delay)
                 message_queue.put_nowait(msg_data["message"])
         except asyncio.CancelledError:
             # Handle cancellation gracefully
@@ -628,7 +795,8 @@ class MockWsTransport(WsTransport, ValueReplacerMixin):
                 finally:
                     # Idle for capture duration to let any ongoing captures complete
                     # This needs to happen BEFORE the wrapped transport context exits
-                    await asyncio.sleep(self.capture_duration)
+                    if self._active_subscriptions:
+                        await asyncio.sleep(self.capture_duration)
 
     async def run_forever(self) -> None:
         """Run the websocket manager main loop forever or until it is cancelled."""
@@ -650,22 +818,27 @@ class MockWsTransport(WsTransport, ValueReplacerMixin):
 
     def _get_fixture_path(self, fixture_name: str) -> Path:
         """Get the path to a fixture file."""
-        # Sanitize fixture name for filesystem
-        safe_name = fixture_name.replace(":", "_")
-        return self.fixture_dir / f"{safe_name}.json"
+        fixture_path = self._fixture_paths.get(fixture_name)
+        if fixture_path is None:
+            # Sanitize fixture name for filesystem
+            safe_name = fixture_name.replace(":", "_")
+            fixture_path = self.fixture_dir / f"{safe_name}.json"
+            self._fixture_paths[fixture_name] = fixture_path
+        return fixture_path
 
     def _normalize_payload(self, payload: Any) -> Any:
         """Normalize payload for matching by removing or standardizing dynamic fields."""
-        if not isinstance(payload, dict):
-            return payload
-
-        # For exchange endpoints, only match on the action, ignore dynamic fields
-        if "action" in payload:
-            normalized = {"action": payload.get("action")}
-            # Keep vaultAddress as it's part of the logical request
-            if "vaultAddress" in payload:
-                normalized["vaultAddress"] = payload["vaultAddress"]
-            return normalized
-        else:
+        # A single lookup against a sentinel replaces the separate membership test
+        action = (
+            payload.get("action", _MISSING) if isinstance(payload, dict) else _MISSING
+        )
+        if action is _MISSING:
             # For info endpoints, use the full payload as it's typically static
             return payload
+
+        # For exchange endpoints, only match on the action, ignore dynamic fields.
+        # Keep vaultAddress as it's part of the logical request, even when None
+        vault_address = payload.get("vaultAddress", _MISSING)
+        if vault_address is _MISSING:
+            return {"action": action}
+        return {"action": action, "vaultAddress": vault_address}
@@ -0,0 +1,34 @@
+from typing import Any
+
+from hl import TESTNET, BaseTransport
+from hl.errors import ApiError
+from hl.result import Result
+from hl.validator import Rule
+
+
+class RecordingTransport(BaseTransport):
+    """Transport that records payloads and answers every request with a fixed result.
+
+    Usage:
+        >>> transport = RecordingTransport(Result.ok({"BTC": "110000.0"}))
+        >>> info = Info(transport=transport)
+        >>> await info.all_mids()
+        >>> assert len(transport.payloads) == 1
+    """
+
+    def __init__(self, result: Result[Any, ApiError]) -> None:
+        """Initialize the transport with no recorded payloads.
+
+        Args:
+            result: The result returned for every request; can be replaced at any time
+        """
+        self.network = TESTNET
+        self.result = result
+        self.payloads: list[Any] = []
+
+    async def invoke(
+        self, payload: Any, validators: list[Rule] | None = None
+    ) -> Result[Any, ApiError]:
+        """Record the payload and return the configured result."""
+        self.payloads.append(payload)
+        return self.result
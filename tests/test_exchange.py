@@ -1,16 +1,26 @@
 import os
 from datetime import UTC, datetime
 from decimal import Decimal
-from typing import AsyncGenerator, cast
+from typing import Any, AsyncGenerator, TypeVar, cast
 
 import pytest
-
-from hl import TESTNET, Account, Cloid, Exchange, HttpTransport, Universe
+import pytest_asyncio
+
+from hl import (
+    TESTNET,
+    Account,
+    Cloid,
+    Exchange,
+    HttpTransport,
+    Universe,
+)
 from hl.constants import LIMIT_GTC
-from hl.errors import StatusError
+from hl.errors import ApiError, StatusError
+from hl.result import Result
 from hl.types import AssetInfo, ModifyParams, OrderResponseDataStatusResting
 from tests.conftest import ReplaceValues
 from tests.mock_http_transport import MockHttpTransport
+from tests.recording_transport import RecordingTransport
 
 # Mock account info for tests
 
@@ -42,20 +52,63 @@ VALIDATOR_ADDRESS = os.getenv(
     "VALIDATOR_ADDRESS", "0x0000000000000000000000000000000000000005"
 )
 
+# Order parameters shared by the order tests, built once per module
+BTC_ORDER_SIZE = Decimal("0.01")
+BTC_ORDER_PRICE = Decimal("105_000")
+# Client order id of the order placed, then cancelled, by the cloid tests
+TEST_CLOID = Cloid.from_int(1337)
+
+T = TypeVar("T")
+
+
+def _assert_ok(response: Result[T, ApiError], response_type: str | None = None) -> T:
+    """Assert that a request succeeded with an "ok" status and return its data.
+
+    Args:
+        response: The result returned by the exchange client
+        response_type: The expected response type, if it should be checked
+    """
+    assert response.is_ok()
+    response_data = response.unwrap()
+    data = cast(Any, response_data)
+    assert data["status"] == "ok"
+    if response_type is not None:
+        assert data["response"]["type"] == response_type
+    return response_data
+
+
+# Run every test on one module-wide event loop so the HTTP transport can be shared
+pytestmark = pytest.mark.asyncio(loop_scope="module")
 
-@pytest.fixture
-async def exchange_client() -> AsyncGenerator[Exchange, None]:
+
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def exchange_transport() -> AsyncGenerator[HttpTransport, None]:
+    """Create the HTTP transport shared by all tests in this module.
+
+    Each test wraps it in its own MockHttpTransport, so capture and replay stay
+    per test while the httpx client and its connection pool are built once. The
+    client is closed when the module is done, since the garbage-collection cleanup
+    is disabled in tests.
+    """
+    transport = HttpTransport(TESTNET, "exchange")
+    yield transport
+    await transport._http_client.aclose()
+
+
+@pytest_asyncio.fixture(loop_scope="module")
+async def exchange_client(
+    exchange_transport: HttpTransport,
+) -> AsyncGenerator[Exchange, None]:
     """Create an Exchange client for testing."""
-    real_transport = HttpTransport(TESTNET, "exchange")
-    mock_transport = MockHttpTransport(real_transport)
+    mock_transport = MockHttpTransport(exchange_transport)
     client = Exchange(
         transport=mock_transport,
         universe=MOCK_UNIVERSE,
         account=TEST_ACCOUNT,
     )
-    mock_transport.start()
+    await mock_transport.astart()
     yield client
-    mock_transport.stop()
+    await mock_transport.astop()
 
 
 async def test_place_order(exchange_client: Exchange) -> None:
@@ -63,8 +116,8 @@ async def test_place_order(exchange_client: Exchange) -> None:
     response = await exchange_client.place_order(
         asset="BTC",
         is_buy=True,
-        size=Decimal("0.01"),
-        limit_price=Decimal("105_000"),
+        size=BTC_ORDER_SIZE,
+        limit_price=BTC_ORDER_PRICE,
         order_type=LIMIT_GTC,
     )
 
@@ -93,12 +146,12 @@ async def test_place_order(exchange_client: Exchange) -> None:
 
 async def test_place_order_custom_cloid(exchange_client: Exchange) -> None:
     """Test placing an order with a custom cloid."""
-    cloid = Cloid.from_int(1337)
+    cloid = TEST_CLOID
     response = await exchange_client.place_order(
         asset="BTC",
         is_buy=True,
-        size=Decimal("0.01"),
-        limit_price=Decimal("105_000"),
+        size=BTC_ORDER_SIZE,
+        limit_price=BTC_ORDER_PRICE,
         order_type=LIMIT_GTC,
         cloid=cloid,
     )
@@ -133,25 +186,19 @@ async def test_cancel_order(exchange_client: Exchange) -> None:
         asset="BTC",
         order_id=33753639142,
     )
-    assert response.is_ok()
-    response_data = response.unwrap()
-    assert response_data["status"] == "ok"
-    assert response_data["response"]["type"] == "cancel"
+    response_data = _assert_ok(response, "cancel")
     assert len(response_data["response"]["data"]["statuses"]) == 1
     order_status = response_data["response"]["data"]["statuses"][0]
     assert order_status == "success"
 
 
 async def test_cancel_order_by_id(exchange_client: Exchange) -> None:
-    cloid = Cloid.from_int(1337)
+    cloid = TEST_CLOID
     response = await exchange_client.cancel_order_by_id(
         asset="BTC",
         client_order_id=cloid,
     )
-    assert response.is_ok()
-    response_data = response.unwrap()
-    assert response_data["status"] == "ok"
-    assert response_data["response"]["type"] == "cancel"
+    response_data = _assert_ok(response, "cancel")
     assert len(response_data["response"]["data"]["statuses"]) == 1
     order_status = response_data["response"]["data"]["statuses"][0]
     assert order_status == "success"
@@ -168,15 +215,12 @@ async def test_modify_order(exchange_client: Exchange) -> None:
     response = await exchange_client.modify_order(
         asset="BTC",
         order_id=33961768362,
-        limit_price=Decimal("105_000"),
+        limit_price=BTC_ORDER_PRICE,
         is_buy=True,
-        size=Decimal("0.01"),
+        size=BTC_ORDER_SIZE,
         order_type=LIMIT_GTC,
     )
-    assert response.is_ok()
-    response_data = response.unwrap()
-    assert response_data["status"] == "ok"
-    assert response_data["response"]["type"] == "default"
+    _assert_ok(response, "default")
 
 
 async def test_modify_order_with_cloid(exchange_client: Exchange) -> None:
@@ -188,10 +232,7 @@ async def test_modify_order_with_cloid(exchange_client: Exchange) -> None:
         size=Decimal("0.004"),
         order_type=LIMIT_GTC,
     )
-    assert response.is_ok()
-    response_data = response.unwrap()
-    assert response_data["status"] == "ok"
-    assert response_data["response"]["type"] == "default"
+    _assert_ok(response, "default")
 
 
 async def test_modify_orders(exchange_client: Exchange) -> None:
@@ -210,10 +251,7 @@ async def test_modify_orders(exchange_client: Exchange) -> None:
             )
         ]
     )
-    assert response.is_ok()
-    response_data = response.unwrap()
-    assert response_data["status"] == "ok"
-    assert response_data["response"]["type"] == "order"
+    response_data = _assert_ok(response, "order")
     assert "resting" in response_data["response"]["data"]["statuses"][0]
     status = cast(
         OrderResponseDataStatusResting, response_data["response"]["data"]["statuses"][0]
@@ -221,16 +259,46 @@ async def test_modify_orders(exchange_client: Exchange) -> None:
     assert status["resting"]["oid"] == 33962423094
 
 
+async def test_modify_orders_sends_single_batch() -> None:
+    """Test that several modifies are signed and sent as one batchModify action."""
+    transport = RecordingTransport(
+        Result.ok(
+            {"status": "ok", "response": {"type": "order", "data": {"statuses": []}}}
+        )
+    )
+    client = Exchange(transport=transport, universe=MOCK_UNIVERSE, account=TEST_ACCOUNT)
+    order_ids = [33961871564, 33961871565, 33961871566, 33961871567]
+    response = await client.modify_orders(
+        modify_requests=[
+            ModifyParams(
+                order_id=order_id,
+                order={
+                    "asset": "BTC",
+                    "limit_price": Decimal("104_000"),
+                    "is_buy": True,
+                    "size": Decimal("0.004"),
+                    "order_type": LIMIT_GTC,
+                    "reduce_only": False,
+                },
+            )
+            for order_id in order_ids
+        ]
+    )
+    _assert_ok(response, "order")
+
+    assert len(transport.payloads) == 1
+    action = transport.payloads[0]["action"]
+    assert action["type"] == "batchModify"
+    assert [modify["oid"] for modify in action["modifies"]] == order_ids
+
+
 async def test_update_leverage(exchange_client: Exchange) -> None:
     response = await exchange_client.update_leverage(
         asset="BTC",
         leverage=14,
         margin_mode="isolated",
     )
-    assert response.is_ok()
-    response_data = response.unwrap()
-    assert response_data["status"] == "ok"
-    assert response_data["response"]["type"] == "default"
+    _assert_ok(response, "default")
 
 
 async def test_update_margin(exchange_client: Exchange) -> None:
@@ -238,10 +306,7 @@ async def test_update_margin(exchange_client: Exchange) -> None:
         asset="BTC",
         amount=Decimal("175"),
     )
-    assert response.is_ok()
-    response_data = response.unwrap()
-    assert response_data["status"] == "ok"
-    assert response_data["response"]["type"] == "default"
+    _assert_ok(response, "default")
 
 
 async def test_adjust_margin_to_1(exchange_client: Exchange) -> None:
@@ -249,10 +314,7 @@ async def test_adjust_margin_to_1(exchange_client: Exchange) -> None:
         asset="WIF",
         leverage=Decimal("1.0"),
     )
-    assert response.is_ok()
-    response_data = response.unwrap()
-    assert response_data["status"] == "ok"
-    assert response_data["response"]["type"] == "default"
+    _assert_ok(response, "default")
 
 
 async def test_adjust_margin_to_0_5(exchange_client: Exchange) -> None:
@@ -260,10 +322,7 @@ async def test_adjust_margin_to_0_5(exchange_client: Exchange) -> None:
         asset="WIF",
         leverage=Decimal("0.5"),
     )
-    assert response.is_ok()
-    response_data = response.unwrap()
-    assert response_data["status"] == "ok"
-    assert response_data["response"]["type"] == "default"
+    _assert_ok(response, "default")
 
 
 async def test_send_usd(
@@ -280,10 +339,7 @@ async def test_send_usd(
             amount=Decimal("100"),
             destination=SECOND_ADDRESS,
         )
-        assert response.is_ok()
-        response_data = response.unwrap()
-        assert response_data["status"] == "ok"
-        assert response_data["response"]["type"] == "default"
+        _assert_ok(response, "default")
 
 
 async def test_send_spot(
@@ -301,9 +357,7 @@ async def test_send_spot(
             amount=Decimal("100"),
             destination=SECOND_ADDRESS,
         )
-        assert response.is_ok()
-        response_data = response.unwrap()
-        assert response_data["status"] == "ok"
+        _assert_ok(response)
 
 
 async def test_send_spot_without_sufficient_balance(
@@ -342,9 +396,7 @@ async def test_send_spot_purr(
             amount=Decimal("10"),
             destination=SECOND_ADDRESS,
         )
-        assert response.is_ok()
-        response_data = response.unwrap()
-        assert response_data["status"] == "ok"
+        _assert_ok(response)
 
 
 async def test_withdraw_funds(
@@ -361,9 +413,7 @@ async def test_withdraw_funds(
             amount=Decimal("100"),
             destination=TEST_ACCOUNT.address,
         )
-        assert response.is_ok()
-        response_data = response.unwrap()
-        assert response_data["status"] == "ok"
+        _assert_ok(response)
 
 
 async def test_transfer_usd(
@@ -378,10 +428,7 @@ async def test_transfer_usd(
         response = await exchange_client.transfer_usd(
             amount=Decimal("25_000"), to_perp=True
         )
-        assert response.is_ok()
-        response_data = response.unwrap()
-        assert response_data["status"] == "ok"
-        assert response_data["response"]["type"] == "default"
+        _assert_ok(response, "default")
 
 
 # TODO: Find a perp dex to work with
@@ -393,9 +440,7 @@ async def test_transfer_tokens(exchange_client: Exchange) -> None:
         dex="PURR",
         token="PURR",
     )
-    assert response.is_ok()
-    response_data = response.unwrap()
-    assert response_data["status"] == "ok"
+    _assert_ok(response)
 
 
 async def test_stake_tokens(
@@ -408,10 +453,7 @@ async def test_stake_tokens(
         },
     ):
         response = await exchange_client.stake_tokens(amount=Decimal("6"))
-        assert response.is_ok()
-        response_data = response.unwrap()
-        assert response_data["status"] == "ok"
-        assert response_data["response"]["type"] == "default"
+        _assert_ok(response, "default")
 
 
 async def test_unstake_tokens(
@@ -424,10 +466,7 @@ async def test_unstake_tokens(
         },
     ):
         response = await exchange_client.unstake_tokens(amount=Decimal("2.1"))
-        assert response.is_ok()
-        response_data = response.unwrap()
-        assert response_data["status"] == "ok"
-        assert response_data["response"]["type"] == "default"
+        _assert_ok(response, "default")
 
 
 async def test_delegate_tokens(
@@ -445,10 +484,7 @@ async def test_delegate_tokens(
             amount=Decimal("0.5"),
             is_undelegate=False,
         )
-        assert response.is_ok()
-        response_data = response.unwrap()
-        assert response_data["status"] == "ok"
-        assert response_data["response"]["type"] == "default"
+        _assert_ok(response, "default")
 
 
 async def test_undelegate_tokens(
@@ -466,10 +502,7 @@ async def test_undelegate_tokens(
             amount=Decimal("0.5"),
             is_undelegate=True,
         )
-        assert response.is_ok()
-        response_data = response.unwrap()
-        assert response_data["status"] == "ok"
-        assert response_data["response"]["type"] == "default"
+        _assert_ok(response, "default")
 
 
 async def test_transfer_vault_funds(
@@ -482,9 +515,7 @@ async def test_transfer_vault_funds(
         response = await exchange_client.transfer_vault_funds(
             vault=VAULT_ADDRESS, amount=Decimal("62"), is_deposit=True
         )
-        assert response.is_ok()
-        response_data = response.unwrap()
-        assert response_data["status"] == "ok"
+        _assert_ok(response)
 
 
 async def test_transfer_vault_funds_withdrawal(
@@ -499,9 +530,7 @@ async def test_transfer_vault_funds_withdrawal(
         response = await exchange_client.transfer_vault_funds(
             vault=VAULT_ADDRESS, amount=Decimal("431"), is_deposit=False
         )
-        assert response.is_ok()
-        response_data = response.unwrap()
-        assert response_data["status"] == "ok"
+        _assert_ok(response)
 
 
 async def test_approve_agent(
@@ -514,10 +543,7 @@ async def test_approve_agent(
         response = await exchange_client.approve_agent(
             agent=AGENT_ADDRESS, name="TestAgent"
         )
-        assert response.is_ok()
-        response_data = response.unwrap()
-        assert response_data["status"] == "ok"
-        assert response_data["response"]["type"] == "default"
+        _assert_ok(response, "default")
 
 
 async def test_approve_builder(
@@ -534,10 +560,7 @@ async def test_approve_builder(
             builder=SECOND_ADDRESS,
             max_fee_rate=Decimal("0.0001"),  # 0.01%
         )
-        assert response.is_ok()
-        response_data = response.unwrap()
-        assert response_data["status"] == "ok"
-        assert response_data["response"]["type"] == "default"
+        _assert_ok(response, "default")
 
 
 async def test_place_twap(exchange_client: Exchange) -> None:
@@ -548,27 +571,18 @@ async def test_place_twap(exchange_client: Exchange) -> None:
         randomize=True,
         is_buy=True,
     )
-    assert response.is_ok()
-    response_data = response.unwrap()
-    assert response_data["status"] == "ok"
-    assert response_data["response"]["type"] == "twapOrder"
+    _assert_ok(response, "twapOrder")
 
 
 async def test_cancel_twap(exchange_client: Exchange) -> None:
     response = await exchange_client.cancel_twap(asset="BTC", twap_id=6552)
-    assert response.is_ok()
-    response_data = response.unwrap()
-    assert response_data["status"] == "ok"
-    assert response_data["response"]["type"] == "twapCancel"
+    response_data = _assert_ok(response, "twapCancel")
     assert response_data["response"]["data"]["status"] == "success"
 
 
 async def test_reserve_weight(exchange_client: Exchange) -> None:
     response = await exchange_client.reserve_weight(weight=100)
-    assert response.is_ok()
-    response_data = response.unwrap()
-    assert response_data["status"] == "ok"
-    assert response_data["response"]["type"] == "default"
+    _assert_ok(response, "default")
 
 
 async def test_create_vault(
@@ -584,10 +598,7 @@ async def test_create_vault(
             description="This is a test vault please ignore",
             initial_usd=Decimal("200"),
         )
-        assert response.is_ok()
-        response_data = response.unwrap()
-        assert response_data["status"] == "ok"
-        assert response_data["response"]["type"] == "createVault"
+        response_data = _assert_ok(response, "createVault")
         assert response_data["response"]["data"] == VAULT_ADDRESS
 
 
@@ -599,19 +610,13 @@ async def test_create_sub_account(
         response={"response.data": SUB_ACCOUNT_ADDRESS},
     ):
         response = await exchange_client.create_sub_account(name="testplsignore")
-        assert response.is_ok()
-        response_data = response.unwrap()
-        assert response_data["status"] == "ok"
-        assert response_data["response"]["type"] == "createSubAccount"
+        response_data = _assert_ok(response, "createSubAccount")
         assert response_data["response"]["data"] == SUB_ACCOUNT_ADDRESS
 
 
 async def test_register_referrer(exchange_client: Exchange) -> None:
     response = await exchange_client.register_referrer(code="TESTCODEPLSIGNORE")
-    assert response.is_ok()
-    response_data = response.unwrap()
-    assert response_data["status"] == "ok"
-    assert response_data["response"]["type"] == "default"
+    _assert_ok(response, "default")
 
 
 async def test_register_referrer_with_not_enough_volume(
@@ -1,11 +1,14 @@
+import asyncio
 import os
 from datetime import datetime, timezone
-from typing import AsyncGenerator, TypeGuard
+from typing import AsyncGenerator, Generator, TypeGuard
 
 import pytest
+import pytest_asyncio
 
 from hl import TESTNET, Account, Cloid, HttpTransport, Info, Universe
 from hl.errors import HttpError, NotFoundError, StatusError, UnexpectedSchemaError
+from hl.result import Result
 from hl.types import (
     AssetInfo,
     DelegatorDeltaCDeposit,
@@ -14,6 +17,7 @@ from hl.types import (
 )
 from tests.conftest import ReplaceValues
 from tests.mock_http_transport import MockHttpTransport
+from tests.recording_transport import RecordingTransport
 
 # Mock account info for tests
 
@@ -35,20 +39,53 @@ SUB_ACCOUNT_ADDRESS = os.getenv(
 )
 VAULT_ADDRESS = os.getenv("VAULT_ADDRESS", "0x0000000000000000000000000000000000000002")
 
+# Client order ids of the open order and of an unknown order, built once per module
+TEST_CLOID = Cloid.from_int(1337)
+UNKNOWN_CLOID = Cloid.from_int(501)
 
-@pytest.fixture
-async def info_client() -> AsyncGenerator[Info, None]:
+
+# Run every test on one module-wide event loop so the HTTP transport can be shared
+pytestmark = pytest.mark.asyncio(loop_scope="module")
+
+
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def info_transport() -> AsyncGenerator[HttpTransport, None]:
+    """Create the HTTP transport shared by all tests in this module.
+
+    Each test wraps it in its own MockHttpTransport, so capture and replay stay
+    per test while the httpx client and its connection pool are built once. The
+    client is closed when the module is done, since the garbage-collection cleanup
+    is disabled in tests.
+    """
+    transport = HttpTransport(TESTNET, "info")
+    yield transport
+    await transport._http_client.aclose()
+
+
+@pytest_asyncio.fixture(loop_scope="module")
+async def info_client(info_transport: HttpTransport) -> AsyncGenerator[Info, None]:
     """Create an Info client for testing."""
-    real_transport = HttpTransport(TESTNET, "info")
-    mock_transport = MockHttpTransport(real_transport)
+    mock_transport = MockHttpTransport(info_transport)
     client = Info(
         transport=mock_transport, universe=MOCK_UNIVERSE, account=TEST_ACCOUNT
     )
 
     # Start the mock transport
-    mock_transport.start()
+    await mock_transport.astart()
     yield client
-    mock_transport.stop()
+    await mock_transport.astop()
+
+
+@pytest.fixture
+def replace_user(
+    info_client: Info, replace_values: ReplaceValues
+) -> Generator[None, None, None]:
+    """Replace the user of captured requests with the TEST_ACCOUNT address."""
+    with replace_values(
+        info_client.transport,
+        request={"user": TEST_ACCOUNT.address},
+    ):
+        yield
 
 
 async def test_all_mids(info_client: Info) -> None:
@@ -83,25 +120,99 @@ async def test_all_mids_with_unknown_dex(info_client: Info) -> None:
     assert isinstance(error, NotFoundError)
 
 
-async def test_user_open_orders(
-    info_client: Info, replace_values: ReplaceValues
-) -> None:
+MOCK_MIDS = {"BTC": "110000.0", "ETH": "1000.0"}
+
+
+class FakeClock:
+    """Stand-in for the time module in hl.info, advanced by hand."""
+
+    def __init__(self) -> None:
+        """Initialize the clock at zero."""
+        self.now = 0.0
+
+    def monotonic(self) -> float:
+        """Get the current fake time."""
+        return self.now
+
+
+@pytest.fixture
+def fake_clock(monkeypatch: pytest.MonkeyPatch) -> FakeClock:
+    """Replace the clock used by the all_mids cache."""
+    clock = FakeClock()
+    # Only hl.info's reference is replaced, so the event loop keeps its own clock
+    monkeypatch.setattr("hl.info.time", clock)
+    return clock
+
+
+async def test_all_mids_cached(fake_clock: FakeClock) -> None:
+    """Test that all_mids reuses a cached response within mids_ttl."""
+    transport = RecordingTransport(Result.ok(dict(MOCK_MIDS)))
+    info_client = Info(transport=transport, mids_ttl=60.0)
+
+    first = (await info_client.all_mids()).unwrap()
+    # Modifying a response must not change what later calls get from the cache
+    first["BTC"] = "0"
+    fake_clock.now = 59.0
+    second = (await info_client.all_mids()).unwrap()
+
+    assert len(transport.payloads) == 1
+    assert second == MOCK_MIDS
+
+
+async def test_all_mids_cache_expires(fake_clock: FakeClock) -> None:
+    """Test that a cached all_mids response is refetched once mids_ttl has passed."""
+    transport = RecordingTransport(Result.ok(dict(MOCK_MIDS)))
+    info_client = Info(transport=transport, mids_ttl=60.0)
+
+    await info_client.all_mids()
+    fake_clock.now = 60.0
+    await info_client.all_mids()
+    # The refetched response is cached again
+    fake_clock.now = 61.0
+    await info_client.all_mids()
+
+    assert len(transport.payloads) == 2
+
+
+async def test_all_mids_not_cached_by_default(fake_clock: FakeClock) -> None:
+    """Test that all_mids makes a request on every call without mids_ttl."""
+    transport = RecordingTransport(Result.ok(dict(MOCK_MIDS)))
+    info_client = Info(transport=transport)
+
+    await info_client.all_mids()
+    await info_client.all_mids()
+
+    assert len(transport.payloads) == 2
+
+
+async def test_all_mids_errors_not_cached(fake_clock: FakeClock) -> None:
+    """Test that a failed all_mids response is not cached."""
+    transport = RecordingTransport(
+        Result.err(HttpError(message="Internal Server Error", status_code=500))
+    )
+    info_client = Info(transport=transport, mids_ttl=60.0)
+
+    assert (await info_client.all_mids()).is_err()
+    transport.result = Result.ok(dict(MOCK_MIDS))
+    assert (await info_client.all_mids()).unwrap() == MOCK_MIDS
+
+    assert len(transport.payloads) == 2
+
+
+async def test_user_open_orders(info_client: Info, replace_user: None) -> None:
     """Test fetching user open orders."""
-    with replace_values(
-        info_client.transport,
-        request={"user": TEST_ACCOUNT.address},
-    ):
-        result = await info_client.user_open_orders()
-        assert result.is_ok()
-        response = result.unwrap()
-        assert isinstance(response, list)
-        assert len(response) == 1
+    result = await info_client.user_open_orders()
+    assert result.is_ok()
+    response = result.unwrap()
+    assert isinstance(response, list)
+    assert len(response) == 1
 
 
-async def test_user_open_orders_with_address(replace_values: ReplaceValues) -> None:
+async def test_user_open_orders_with_address(
+    info_transport: HttpTransport, replace_values: ReplaceValues
+) -> None:
     """Test fetching user open orders with an unauthenticated api client and address."""
-    real_transport = HttpTransport(TESTNET, "info")
-    mock_transport = MockHttpTransport(real_transport)
+    mock_transport = MockHttpTransport(info_transport)
     info_client = Info(transport=mock_transport)
 
     mock_transport.start()
@@ -117,10 +228,11 @@ async def test_user_open_orders_with_address(replace_values: ReplaceValues) -> N
     mock_transport.stop()
 
 
-async def test_user_open_orders_with_account(replace_values: ReplaceValues) -> None:
+async def test_user_open_orders_with_account(
+    info_transport: HttpTransport, replace_values: ReplaceValues
+) -> None:
     """Test fetching user open orders with an authenticated api client and account."""
-    real_transport = HttpTransport(TESTNET, "info")
-    mock_transport = MockHttpTransport(real_transport)
+    mock_transport = MockHttpTransport(info_transport)
     info_client = Info(transport=mock_transport, account=TEST_ACCOUNT)
 
     mock_transport.start()
@@ -138,138 +250,104 @@ async def test_user_open_orders_with_account(replace_values: ReplaceValues) -> N
 
 async def test_multiple_api_calls(info_client: Info) -> None:
     """Test that multiple API calls in a single test are captured in one fixture."""
-    # Make multiple different API calls
-    all_mids_result = await info_client.all_mids()
+    # Make multiple different API calls concurrently
+    all_mids_result, meta_result, spot_meta_result = await asyncio.gather(
+        info_client.all_mids(),
+        info_client.perpetual_meta(),
+        info_client.spot_meta(),
+    )
     assert all_mids_result.is_ok()
     all_mids = all_mids_result.unwrap()
     assert isinstance(all_mids, dict)
     assert len(all_mids) > 0
 
-    meta_result = await info_client.perpetual_meta()
     assert meta_result.is_ok()
     meta = meta_result.unwrap()
     assert isinstance(meta, dict)
     assert "universe" in meta
 
-    spot_meta_result = await info_client.spot_meta()
     assert spot_meta_result.is_ok()
     spot_meta = spot_meta_result.unwrap()
     assert isinstance(spot_meta, dict)
     assert "universe" in spot_meta
 
 
-async def test_user_frontend_open_orders(
-    info_client: Info, replace_values: ReplaceValues
-) -> None:
+async def test_user_frontend_open_orders(info_client: Info, replace_user: None) -> None:
     """Test fetching user frontend open orders."""
-    with replace_values(
-        info_client.transport,
-        request={"user": TEST_ACCOUNT.address},
-    ):
-        result = await info_client.user_frontend_open_orders()
-        assert result.is_ok()
-        response = result.unwrap()
-        assert isinstance(response, list)
-        assert len(response) == 1
+    result = await info_client.user_frontend_open_orders()
+    assert result.is_ok()
+    response = result.unwrap()
+    assert isinstance(response, list)
+    assert len(response) == 1
 
 
-async def test_user_historical_orders(
-    info_client: Info, replace_values: ReplaceValues
-) -> None:
+async def test_user_historical_orders(info_client: Info, replace_user: None) -> None:
     """Test fetching user historical orders."""
-    with replace_values(
-        info_client.transport,
-        request={"user": TEST_ACCOUNT.address},
-    ):
-        result = await info_client.user_historical_orders()
-        assert result.is_ok()
-        response = result.unwrap()
-        assert isinstance(response, list)
-        assert len(response) == 34
+    result = await info_client.user_historical_orders()
+    assert result.is_ok()
+    response = result.unwrap()
+    assert isinstance(response, list)
+    assert len(response) == 34
 
 
-async def test_user_fills(info_client: Info, replace_values: ReplaceValues) -> None:
+async def test_user_fills(info_client: Info, replace_user: None) -> None:
     """Test fetching user fills."""
-    with replace_values(
-        info_client.transport,
-        request={"user": TEST_ACCOUNT.address},
-    ):
-        result = await info_client.user_fills()
-        assert result.is_ok()
-        response = result.unwrap()
-        assert isinstance(response, list)
-        assert len(response) == 2
-        assert response[0]["coin"] == "BTC"
+    result = await info_client.user_fills()
+    assert result.is_ok()
+    response = result.unwrap()
+    assert isinstance(response, list)
+    assert len(response) == 2
+    assert response[0]["coin"] == "BTC"
 
 
-async def test_user_fills_by_time(
-    info_client: Info, replace_values: ReplaceValues
-) -> None:
+async def test_user_fills_by_time(info_client: Info, replace_user: None) -> None:
     """Test fetching user fills by time."""
-    with replace_values(
-        info_client.transport,
-        request={"user": TEST_ACCOUNT.address},
-    ):
-        result = await info_client.user_fills_by_time(
-            start=datetime(2025, 6, 15, 16, 30, 0),
-            end=datetime(2025, 6, 15, 16, 48, 0),
-        )
-        assert result.is_ok()
-        response = result.unwrap()
-        assert isinstance(response, list)
-        assert len(response) == 1
-        assert response[0]["coin"] == "BTC"
+    result = await info_client.user_fills_by_time(
+        start=datetime(2025, 6, 15, 16, 30, 0),
+        end=datetime(2025, 6, 15, 16, 48, 0),
+    )
+    assert result.is_ok()
+    response = result.unwrap()
+    assert isinstance(response, list)
+    assert len(response) == 1
+    assert response[0]["coin"] == "BTC"
 
 
 async def test_user_fills_by_time_aggregate_by_time(
-    info_client: Info, replace_values: ReplaceValues
+    info_client: Info, replace_user: None
 ) -> None:
     """Test fetching user fills by time."""
-    with replace_values(
-        info_client.transport,
-        request={"user": TEST_ACCOUNT.address},
-    ):
-        result = await info_client.user_fills_by_time(
-            start=datetime(2025, 6, 15, 18, 5, 0),
-            end=datetime(2025, 6, 15, 18, 30, 0),
-            # TODO: How exactly can we create a test case for this?
-            # Currently, only a single fill is returned regardless of aggregate_by_time's value
-            aggregate_by_time=True,
-        )
-        assert result.is_ok()
-        response = result.unwrap()
-        assert isinstance(response, list)
-        assert len(response) == 1
-        assert response[0]["coin"] == "DOGE"
+    result = await info_client.user_fills_by_time(
+        start=datetime(2025, 6, 15, 18, 5, 0),
+        end=datetime(2025, 6, 15, 18, 30, 0),
+        # TODO: How exactly can we create a test case for this?
+        # Currently, only a single fill is returned regardless of aggregate_by_time's value
+        aggregate_by_time=True,
+    )
+    assert result.is_ok()
+    response = result.unwrap()
+    assert isinstance(response, list)
+    assert len(response) == 1
+    assert response[0]["coin"] == "DOGE"
 
 
-async def test_user_rate_limit(
-    info_client: Info, replace_values: ReplaceValues
-) -> None:
+async def test_user_rate_limit(info_client: Info, replace_user: None) -> None:
     """Test fetching user rate limit."""
-    with replace_values(
-        info_client.transport,
-        request={"user": TEST_ACCOUNT.address},
-    ):
-        result = await info_client.user_rate_limit()
-        assert result.is_ok()
-        response = result.unwrap()
-        assert isinstance(response, dict)
-        assert isinstance(response["cumVlm"], str)
-        assert isinstance(response["nRequestsUsed"], int)
-        assert isinstance(response["nRequestsCap"], int)
+    result = await info_client.user_rate_limit()
+    assert result.is_ok()
+    response = result.unwrap()
+    assert isinstance(response, dict)
+    assert isinstance(response["cumVlm"], str)
+    assert isinstance(response["nRequestsUsed"], int)
+    assert isinstance(response["nRequestsCap"], int)
 
 
-async def test_order_status(info_client: Info, replace_values: ReplaceValues) -> None:
+async def test_order_status(info_client: Info, replace_user: None) -> None:
     """Test fetching order status."""
     order_id = 33845539264
-    with replace_values(
-        info_client.transport,
-        request={"user": TEST_ACCOUNT.address},
-    ):
-        result = await info_client.order_status(order_id=order_id)
-        assert result.is_ok()
-        response = result.unwrap()
+    result = await info_client.order_status(order_id=order_id)
+    assert result.is_ok()
+    response = result.unwrap()
     assert isinstance(response, dict)
     assert "status" in response
     assert response["status"] == "order"
@@ -277,18 +355,12 @@ async def test_order_status(info_client: Info, replace_values: ReplaceValues) ->
     assert response["order"]["status"] == "open"
 
 
-async def test_order_status_with_cloid(
-    info_client: Info, replace_values: ReplaceValues
-) -> None:
+async def test_order_status_with_cloid(info_client: Info, replace_user: None) -> None:
     """Test fetching order status with the client order id."""
-    cloid = Cloid.from_int(1337)
-    with replace_values(
-        info_client.transport,
-        request={"user": TEST_ACCOUNT.address},
-    ):
-        result = await info_client.order_status(order_id=cloid)
-        assert result.is_ok()
-        response = result.unwrap()
+    cloid = TEST_CLOID
+    result = await info_client.order_status(order_id=cloid)
+    assert result.is_ok()
+    response = result.unwrap()
     assert isinstance(response, dict)
     assert "status" in response
     assert response["status"] == "order"
@@ -297,20 +369,16 @@ async def test_order_status_with_cloid(
 
 
 async def test_order_status_with_unknown_cloid(
-    info_client: Info, replace_values: ReplaceValues
+    info_client: Info, replace_user: None
 ) -> None:
     """Test fetching order status with the client order id."""
-    cloid = Cloid.from_int(501)
-    with replace_values(
-        info_client.transport,
-        request={"user": TEST_ACCOUNT.address},
-    ):
-        result = await info_client.order_status(order_id=cloid)
-        assert result.is_err()
-        error = result.unwrap_err()
-        assert isinstance(error, StatusError)
-        assert error.expected == "order"
-        assert error.actual == "unknownOid"
+    cloid = UNKNOWN_CLOID
+    result = await info_client.order_status(order_id=cloid)
+    assert result.is_err()
+    error = result.unwrap_err()
+    assert isinstance(error, StatusError)
+    assert error.expected == "order"
+    assert error.actual == "unknownOid"
 
 
 async def test_l2_book(info_client: Info) -> None:
@@ -387,17 +455,11 @@ async def test_max_builder_fee(
     assert response == 0
 
 
-async def test_user_twap_slice_fills(
-    info_client: Info, replace_values: ReplaceValues
-) -> None:
+async def test_user_twap_slice_fills(info_client: Info, replace_user: None) -> None:
     """Test fetching user TWAP slice fills."""
-    with replace_values(
-        info_client.transport,
-        request={"user": TEST_ACCOUNT.address},
-    ):
-        result = await info_client.user_twap_slice_fills()
-        assert result.is_ok()
-        response = result.unwrap()
+    result = await info_client.user_twap_slice_fills()
+    assert result.is_ok()
+    response = result.unwrap()
     assert isinstance(response, list)
     assert response[0]["twapId"] == 6552
 
@@ -423,19 +485,13 @@ async def test_user_sub_accounts(
     assert response[0]["subAccountUser"] == SUB_ACCOUNT_ADDRESS
 
 
-async def test_user_sub_accounts_empty(
-    info_client: Info, replace_values: ReplaceValues
-) -> None:
+async def test_user_sub_accounts_empty(info_client: Info, replace_user: None) -> None:
     """Test fetching subaccounts when there are no subaccounts."""
-    with replace_values(
-        info_client.transport,
-        request={"user": TEST_ACCOUNT.address},
-    ):
-        result = await info_client.user_sub_accounts()
-        assert result.is_ok()
-        response = result.unwrap()
-        assert isinstance(response, list)
-        assert len(response) == 0
+    result = await info_client.user_sub_accounts()
+    assert result.is_ok()
+    response = result.unwrap()
+    assert isinstance(response, list)
+    assert len(response) == 0
 
 
 async def test_vault_details(info_client: Info, replace_values: ReplaceValues) -> None:
@@ -456,46 +512,30 @@ async def test_vault_details(info_client: Info, replace_values: ReplaceValues) -
     assert response["vaultAddress"] == VAULT_ADDRESS
 
 
-async def test_user_vault_equities(
-    info_client: Info, replace_values: ReplaceValues
-) -> None:
+async def test_user_vault_equities(info_client: Info, replace_user: None) -> None:
     """Test fetching user vault equities."""
-    with replace_values(
-        info_client.transport,
-        request={"user": TEST_ACCOUNT.address},
-    ):
-        result = await info_client.user_vault_equities()
-        assert result.is_ok()
-        response = result.unwrap()
+    result = await info_client.user_vault_equities()
+    assert result.is_ok()
+    response = result.unwrap()
     assert isinstance(response, list)
     assert len(response) == 2
     assert response[0]["equity"] == "20000.0"
 
 
-async def test_user_role(info_client: Info, replace_values: ReplaceValues) -> None:
+async def test_user_role(info_client: Info, replace_user: None) -> None:
     """Test fetching user role."""
-    with replace_values(
-        info_client.transport,
-        request={"user": TEST_ACCOUNT.address},
-    ):
-        result = await info_client.user_role()
-        assert result.is_ok()
-        response = result.unwrap()
+    result = await info_client.user_role()
+    assert result.is_ok()
+    response = result.unwrap()
     assert isinstance(response, dict)
     assert response["role"] == "user"
 
 
-async def test_user_role_with_address(
-    info_client: Info, replace_values: ReplaceValues
-) -> None:
+async def test_user_role_with_address(info_client: Info, replace_user: None) -> None:
     """Test fetching user role with an address."""
-    with replace_values(
-        info_client.transport,
-        request={"user": TEST_ACCOUNT.address},
-    ):
-        result = await info_client.user_role(address=TEST_ACCOUNT.address)
-        assert result.is_ok()
-        response = result.unwrap()
+    result = await info_client.user_role(address=TEST_ACCOUNT.address)
+    assert result.is_ok()
+    response = result.unwrap()
     assert isinstance(response, dict)
     assert response["role"] == "user"
 
@@ -534,91 +574,61 @@ async def test_user_role_with_sub_account_address(
     assert response["data"]["master"] == TEST_ACCOUNT.address.lower()
 
 
-async def test_user_portfolio(info_client: Info, replace_values: ReplaceValues) -> None:
+async def test_user_portfolio(info_client: Info, replace_user: None) -> None:
     """Test fetching user portfolio."""
-    with replace_values(
-        info_client.transport,
-        request={"user": TEST_ACCOUNT.address},
-    ):
-        result = await info_client.user_portfolio()
-        assert result.is_ok()
-        response = result.unwrap()
+    result = await info_client.user_portfolio()
+    assert result.is_ok()
+    response = result.unwrap()
     assert isinstance(response, list)
     assert len(response) == 8
     assert response[0][0] == "day"
 
 
 async def test_user_referral_without_code(
-    info_client: Info, replace_values: ReplaceValues
+    info_client: Info, replace_user: None
 ) -> None:
     """Test fetching user referral."""
-    with replace_values(
-        info_client.transport,
-        request={"user": TEST_ACCOUNT.address},
-    ):
-        result = await info_client.user_referral()
-        assert result.is_ok()
-        response = result.unwrap()
+    result = await info_client.user_referral()
+    assert result.is_ok()
+    response = result.unwrap()
     assert isinstance(response, dict)
     assert response["referredBy"] is None
     assert response["referrerState"]["stage"] == "needToCreateCode"
 
 
-async def test_user_referral_with_code(
-    info_client: Info, replace_values: ReplaceValues
-) -> None:
+async def test_user_referral_with_code(info_client: Info, replace_user: None) -> None:
     """Test fetching user referral with a code."""
-    with replace_values(
-        info_client.transport,
-        request={"user": TEST_ACCOUNT.address},
-    ):
-        result = await info_client.user_referral()
-        assert result.is_ok()
-        response = result.unwrap()
+    result = await info_client.user_referral()
+    assert result.is_ok()
+    response = result.unwrap()
     assert isinstance(response, dict)
     assert response["referrerState"]["stage"] == "ready"
 
 
-async def test_user_fees(info_client: Info, replace_values: ReplaceValues) -> None:
+async def test_user_fees(info_client: Info, replace_user: None) -> None:
     """Test fetching user fees."""
-    with replace_values(
-        info_client.transport,
-        request={"user": TEST_ACCOUNT.address},
-    ):
-        result = await info_client.user_fees()
-        assert result.is_ok()
-        response = result.unwrap()
+    result = await info_client.user_fees()
+    assert result.is_ok()
+    response = result.unwrap()
     assert isinstance(response, dict)
     assert response["activeReferralDiscount"] == "0.0"
 
 
-async def test_user_delegations(
-    info_client: Info, replace_values: ReplaceValues
-) -> None:
+async def test_user_delegations(info_client: Info, replace_user: None) -> None:
     """Test fetching user delegations."""
-    with replace_values(
-        info_client.transport,
-        request={"user": TEST_ACCOUNT.address},
-    ):
-        result = await info_client.user_delegations()
-        assert result.is_ok()
-        response = result.unwrap()
+    result = await info_client.user_delegations()
+    assert result.is_ok()
+    response = result.unwrap()
     assert isinstance(response, list)
     assert len(response) == 1
     assert response[0]["validator"] == "0x8888c8c2c539d56919d20ac58305a5000b26fb67"
 
 
-async def test_user_delegator_summary(
-    info_client: Info, replace_values: ReplaceValues
-) -> None:
+async def test_user_delegator_summary(info_client: Info, replace_user: None) -> None:
     """Test fetching user delegator summary."""
-    with replace_values(
-        info_client.transport,
-        request={"user": TEST_ACCOUNT.address},
-    ):
-        result = await info_client.user_delegator_summary()
-        assert result.is_ok()
-        response = result.unwrap()
+    result = await info_client.user_delegator_summary()
+    assert result.is_ok()
+    response = result.unwrap()
     assert isinstance(response, dict)
     assert response["delegated"] == "0.0"
     assert response["undelegated"] == "0.0"
@@ -647,17 +657,11 @@ def is_cdeposit_delta(
     return "cDeposit" in delta
 
 
-async def test_user_delegator_history(
-    info_client: Info, replace_values: ReplaceValues
-) -> None:
+async def test_user_delegator_history(info_client: Info, replace_user: None) -> None:
     """Test fetching user delegator history."""
-    with replace_values(
-        info_client.transport,
-        request={"user": TEST_ACCOUNT.address},
-    ):
-        result = await info_client.user_delegator_history()
-        assert result.is_ok()
-        response = result.unwrap()
+    result = await info_client.user_delegator_history()
+    assert result.is_ok()
+    response = result.unwrap()
     assert isinstance(response, list)
     assert len(response) == 6
 
@@ -724,15 +728,11 @@ async def test_perpetual_meta_and_asset_ctxs(info_client: Info) -> None:
     assert isinstance(asset_ctxs, list)
 
 
-async def test_user_state(info_client: Info, replace_values: ReplaceValues) -> None:
+async def test_user_state(info_client: Info, replace_user: None) -> None:
     """Test fetching user state."""
-    with replace_values(
-        info_client.transport,
-        request={"user": TEST_ACCOUNT.address},
-    ):
-        result = await info_client.user_state()
-        assert result.is_ok()
-        response = result.unwrap()
+    result = await info_client.user_state()
+    assert result.is_ok()
+    response = result.unwrap()
     assert isinstance(response, dict)
     assert "marginSummary" in response
     assert "crossMarginSummary" in response
@@ -742,18 +742,14 @@ async def test_user_state(info_client: Info, replace_values: ReplaceValues) -> N
     assert "time" in response
 
 
-async def test_user_funding(info_client: Info, replace_values: ReplaceValues) -> None:
+async def test_user_funding(info_client: Info, replace_user: None) -> None:
     """Test fetching user funding."""
-    with replace_values(
-        info_client.transport,
-        request={"user": TEST_ACCOUNT.address},
-    ):
-        result = await info_client.user_funding(
-            start=datetime(2025, 6, 13, 5, 0, 0),
-            end=datetime(2025, 6, 17, 5, 0, 0),
-        )
-        assert result.is_ok()
-        response = result.unwrap()
+    result = await info_client.user_funding(
+        start=datetime(2025, 6, 13, 5, 0, 0),
+        end=datetime(2025, 6, 17, 5, 0, 0),
+    )
+    assert result.is_ok()
+    response = result.unwrap()
     assert isinstance(response, list)
     assert len(response) == 1
     assert response[0]["delta"]["type"] == "funding"
@@ -761,19 +757,15 @@ async def test_user_funding(info_client: Info, replace_values: ReplaceValues) ->
 
 
 async def test_user_non_funding_ledger_updates(
-    info_client: Info, replace_values: ReplaceValues
+    info_client: Info, replace_user: None
 ) -> None:
     """Test fetching user non-funding ledger updates."""
-    with replace_values(
-        info_client.transport,
-        request={"user": TEST_ACCOUNT.address},
-    ):
-        result = await info_client.user_non_funding_ledger_updates(
-            start=datetime(2025, 6, 13, 5, 0, 0),
-            end=datetime(2025, 6, 17, 5, 0, 0),
-        )
-        assert result.is_ok()
-        response = result.unwrap()
+    result = await info_client.user_non_funding_ledger_updates(
+        start=datetime(2025, 6, 13, 5, 0, 0),
+        end=datetime(2025, 6, 17, 5, 0, 0),
+    )
+    assert result.is_ok()
+    response = result.unwrap()
     assert isinstance(response, list)
     assert response[0]["delta"]["type"] == "spotTransfer"
 
@@ -801,10 +793,9 @@ async def test_funding_history_with_end(info_client: Info) -> None:
     response = result.unwrap()
     assert isinstance(response, list)
     assert response[0]["coin"] == "BTC"
-    assert all(
-        datetime.fromtimestamp(entry["time"] // 1000, tz=timezone.utc) < end
-        for entry in response
-    )
+    # Compare epoch milliseconds directly instead of building a datetime per entry
+    end_ms = int(end.timestamp() * 1000)
+    assert max(entry["time"] for entry in response) < end_ms
 
 
 async def test_predicted_fundings(info_client: Info) -> None:
@@ -888,17 +879,11 @@ async def test_spot_meta_and_asset_ctxs(info_client: Info) -> None:
     assert asset_ctxs[0]["coin"] == "PURR/USDC"
 
 
-async def test_spot_user_state(
-    info_client: Info, replace_values: ReplaceValues
-) -> None:
+async def test_spot_user_state(info_client: Info, replace_user: None) -> None:
     """Test fetching spot user state."""
-    with replace_values(
-        info_client.transport,
-        request={"user": TEST_ACCOUNT.address},
-    ):
-        result = await info_client.spot_user_state()
-        assert result.is_ok()
-        response = result.unwrap()
+    result = await info_client.spot_user_state()
+    assert result.is_ok()
+    response = result.unwrap()
     assert isinstance(response, dict)
     assert "balances" in response
     assert isinstance(response["balances"], list)
@@ -907,16 +892,12 @@ async def test_spot_user_state(
 
 
 async def test_spot_deploy_auction_status(
-    info_client: Info, replace_values: ReplaceValues
+    info_client: Info, replace_user: None
 ) -> None:
     """Test fetching spot deploy auction status."""
-    with replace_values(
-        info_client.transport,
-        request={"user": TEST_ACCOUNT.address},
-    ):
-        result = await info_client.spot_deploy_auction_status()
-        assert result.is_ok()
-        response = result.unwrap()
+    result = await info_client.spot_deploy_auction_status()
+    assert result.is_ok()
+    response = result.unwrap()
     assert isinstance(response, dict)
     assert isinstance(response["gasAuction"], dict)
     assert isinstance(response["gasAuction"]["startTimeSeconds"], int)
@@ -22,6 +22,11 @@ MOCK_UNIVERSE = Universe(
     {3: AssetInfo(id=3, name="BTC", type="PERPETUAL", pxDecimals=1, szDecimals=5)}
 )
 
+# Request replacements shared by the user subscription tests, built once per module.
+# The first message of user streams carries the user address as well
+USER_REQUEST = {"user": TEST_ACCOUNT.address}
+USER_MESSAGE_REQUEST = {**USER_REQUEST, "0.message.data.user": TEST_ACCOUNT.address}
+
 
 @pytest.fixture
 async def subscriptions_client() -> AsyncGenerator[Subscriptions, None]:
@@ -30,6 +35,8 @@ async def subscriptions_client() -> AsyncGenerator[Subscriptions, None]:
     mock_transport = MockWsTransport(
         real_transport,
         capture_duration=5.0,
+        # The tests only inspect the first messages of a subscription
+        capture_max_messages=4,
     )
 
     client = Subscriptions(
@@ -37,7 +44,7 @@ async def subscriptions_client() -> AsyncGenerator[Subscriptions, None]:
     )
 
     # Start the mock transport
-    mock_transport.start()
+    await mock_transport.astart()
 
     try:
         # Start the WebSocket connection in the background
@@ -110,7 +117,7 @@ async def test_notification_subscription(
     # Subscribe to notification
     with replace_values(
         subscriptions_client.transport,
-        request={"user": TEST_ACCOUNT.address},
+        request=USER_REQUEST,
     ):
         subscription_id, queue = await subscriptions_client.notification()
 
@@ -125,7 +132,7 @@ async def test_web_data2_subscription(
     # Subscribe to web data 2
     with replace_values(
         subscriptions_client.transport,
-        request={"user": TEST_ACCOUNT.address},
+        request=USER_REQUEST,
     ):
         subscription_id, queue = await subscriptions_client.web_data2()
 
@@ -236,9 +243,7 @@ async def test_order_updates_subscription(
 ) -> None:
     """Test subscribing to order updates."""
     # Subscribe to order updates
-    with replace_values(
-        subscriptions_client.transport, request={"user": TEST_ACCOUNT.address}
-    ):
+    with replace_values(subscriptions_client.transport, request=USER_REQUEST):
         subscription_id, queue = await subscriptions_client.order_updates()
 
     # Verify the subscription was created
@@ -262,9 +267,7 @@ async def test_user_events_subscription(
 ) -> None:
     """Test subscribing to user events updates."""
     # Subscribe to user events
-    with replace_values(
-        subscriptions_client.transport, request={"user": TEST_ACCOUNT.address}
-    ):
+    with replace_values(subscriptions_client.transport, request=USER_REQUEST):
         subscription_id, queue = await subscriptions_client.user_events()
 
     # Wait for at least one message (captured for 5 seconds)
@@ -285,10 +288,7 @@ async def test_user_fills_subscription(
     # Subscribe to user fills
     with replace_values(
         subscriptions_client.transport,
-        request={
-            "user": TEST_ACCOUNT.address,
-            "0.message.data.user": TEST_ACCOUNT.address,
-        },
+        request=USER_MESSAGE_REQUEST,
     ):
         subscription_id, queue = await subscriptions_client.user_fills()
 
@@ -315,10 +315,7 @@ async def test_user_fundings_subscription(
     # Subscribe to user fundings
     with replace_values(
         subscriptions_client.transport,
-        request={
-            "user": TEST_ACCOUNT.address,
-            "0.message.data.user": TEST_ACCOUNT.address,
-        },
+        request=USER_MESSAGE_REQUEST,
     ):
         subscription_id, queue = await subscriptions_client.user_fundings()
 
@@ -343,10 +340,7 @@ async def test_user_non_funding_ledger_updates_subscription(
     # Subscribe to user non-funding ledger updates
     with replace_values(
         subscriptions_client.transport,
-        request={
-            "user": TEST_ACCOUNT.address,
-            "0.message.data.user": TEST_ACCOUNT.address,
-        },
+        request=USER_MESSAGE_REQUEST,
     ):
         (
             subscription_id,
@@ -391,8 +385,7 @@ async def test_active_asset_data_subscription(
     with replace_values(
         subscriptions_client.transport,
         request={
-            "user": TEST_ACCOUNT.address,
-            "0.message.data.user": TEST_ACCOUNT.address,
+            **USER_MESSAGE_REQUEST,
             "1.message.data.user": TEST_ACCOUNT.address,
         },
     ):
@@ -421,10 +414,7 @@ async def test_user_twap_slice_fills_subscription(
     """Test subscribing to user TWAP slice fills updates."""
     with replace_values(
         subscriptions_client.transport,
-        request={
-            "user": TEST_ACCOUNT.address,
-            "0.message.data.user": TEST_ACCOUNT.address,
-        },
+        request=USER_MESSAGE_REQUEST,
     ):
         # Subscribe to user TWAP slice fills
         subscription_id, queue = await subscriptions_client.user_twap_slice_fills()
@@ -455,10 +445,7 @@ async def test_user_twap_history_subscription(
     """Test subscribing to user TWAP history updates."""
     with replace_values(
         subscriptions_client.transport,
-        request={
-            "user": TEST_ACCOUNT.address,
-            "0.message.data.user": TEST_ACCOUNT.address,
-        },
+        request=USER_MESSAGE_REQUEST,
     ):
         # Subscribe to user TWAP history
         subscription_id, queue = await subscriptions_client.user_twap_history()
@@ -6,9 +6,12 @@ from hl import Universe
 from hl.types import AssetInfo
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_universe() -> Universe:
-    """Create a mock universe with various asset types for testing."""
+    """Create a mock universe with various asset types for testing.
+
+    The tests only round with it, so one instance is shared by the whole module.
+    """
     id_to_info = {
         # PERPETUAL asset with pxDecimals=1 (MAX_DECIMALS_PERPETUAL=6, szDecimals=5)
         1: AssetInfo(
@@ -452,3 +455,25 @@ def test_round_size_consistency(mock_universe: Universe) -> None:
     result_float = mock_universe.round_size("BTC", Decimal(1.123456789))
 
     assert result_str == result_float
+
+
+def test_round_price_negative_px_decimals() -> None:
+    """Test rounding for a perpetual with szDecimals > 6, so pxDecimals < 0."""
+    universe = Universe(
+        {1: AssetInfo(id=1, name="TINY", type="PERPETUAL", pxDecimals=-1, szDecimals=7)}
+    )
+
+    assert universe.round_price("TINY", Decimal("123456.7")) == Decimal("123460")
+    assert universe.round_price("TINY", Decimal("4.5")) == Decimal("0")
+    assert universe.round_size("TINY", Decimal("1.123456789")) == Decimal("1.1234568")
+
+
+def test_round_asset_added_after_construction() -> None:
+    """Test rounding for an asset added to id_to_info after construction."""
+    universe = Universe({})
+    universe.id_to_info[5] = AssetInfo(
+        id=5, name="NEW", type="PERPETUAL", pxDecimals=2, szDecimals=2
+    )
+
+    assert universe.round_price(5, Decimal("1.2345")) == Decimal("1.23")
+    assert universe.round_size(5, Decimal("1.2345")) == Decimal("1.23")
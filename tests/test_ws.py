@@ -1,11 +1,11 @@
 import asyncio
 import os
 from decimal import Decimal
-from typing import AsyncGenerator
+from typing import Any, AsyncGenerator
 
 import pytest
 
-from hl import TESTNET, Account, Universe, Ws
+from hl import TESTNET, Account, Universe, Ws, WsTransport
 from hl.types import AssetInfo
 from tests.conftest import ReplaceValues
 from tests.mock_ws_transport import MockWsTransport
@@ -49,7 +49,7 @@ async def ws_client() -> AsyncGenerator[Ws, None]:
         ws._exchange.transport = mock_transport
 
     # Start the mock transport
-    mock_transport.start()
+    await mock_transport.astart()
 
     try:
         # Start the WebSocket connection in the background
@@ -141,3 +141,33 @@ async def test_ws_exchange_transfer_usd(
 
     # The transfer should be successful
     assert response["status"] == "ok"
+
+
+async def test_mock_ws_transport_capture_max_messages() -> None:
+    """Test that capture stores at most capture_max_messages but forwards all."""
+    mock_transport = MockWsTransport(WsTransport(TESTNET), capture_max_messages=2)
+    subscription_id = 1
+    mock_transport._active_subscriptions[subscription_id] = {
+        "subscription": {"type": "allMids"},
+        "start_time": 0.0,
+    }
+    real_queue: asyncio.Queue[Any] = asyncio.Queue()
+    test_queue: asyncio.Queue[Any] = asyncio.Queue()
+    messages = [{"channel": "allMids", "data": {"i": i}} for i in range(5)]
+
+    capture_task = asyncio.create_task(
+        mock_transport._capture_and_forward_messages(
+            subscription_id, real_queue, test_queue
+        )
+    )
+    for message in messages:
+        real_queue.put_nowait(message)
+    forwarded = [
+        await asyncio.wait_for(test_queue.get(), timeout=1.0) for _ in messages
+    ]
+    capture_task.cancel()
+    await capture_task
+
+    assert forwarded == messages
+    (interaction,) = mock_transport._captured_interactions
+    assert [msg["message"] for msg in interaction["messages"]] == messages[:2]
@@ -1,7 +1,51 @@
 import copy
 from contextlib import contextmanager
+from functools import lru_cache
 from typing import Any, Generator
 
+_MISSING = object()
+
+
+@lru_cache(maxsize=1024)
+def _parse_path(path: str) -> tuple[tuple[str, int | None], ...]:
+    """Split a dot-separated path into its keys, each with its list index if numeric.
+
+    Paths come from a small set of replacement mappings, so they are parsed once
+    instead of being split, and their keys tried with int(), on every lookup.
+
+    Args:
+        path: Dot-separated path, with numeric indices for list access
+
+    Returns:
+        The (key, index) pairs, where index is None if the key isn't an integer
+    """
+    parsed = []
+    for key in path.split("."):
+        try:
+            index: int | None = int(key)
+        except ValueError:
+            index = None
+        parsed.append((key, index))
+    return tuple(parsed)
+
+
+def _copy_if_shared(obj: Any, copied: set[int]) -> Any:
+    """Get a shallow copy of a dict or list unless it was already copied.
+
+    Args:
+        obj: The object reached on a replacement path
+        copied: The ids of containers owned by the object being built
+
+    Returns:
+        The object itself if it isn't a container or is already owned, else a copy
+    """
+    if isinstance(obj, (dict, list)):
+        if id(obj) in copied:
+            return obj
+        obj = copy.copy(obj)
+        copied.add(id(obj))
+    return obj
+
 
 class ValueReplacerMixin:
     """Mixin that provides value replacement functionality for nested data structures.
@@ -30,25 +74,19 @@ class ValueReplacerMixin:
         Returns:
             The value at the path, or None if not found
         """
-        keys = path.split(".")
         current = obj
 
-        for key in keys:
+        for key, index in _parse_path(path):
             if isinstance(current, dict):
-                if key in current:
-                    current = current[key]
-                else:
+                # A single lookup, with a sentinel since None is a valid value
+                current = current.get(key, _MISSING)
+                if current is _MISSING:
                     return None
             elif isinstance(current, list):
-                # Try to parse key as integer for list access
-                try:
-                    index = int(key)
-                    if 0 <= index < len(current):
-                        current = current[index]
-                    else:
-                        return None
-                except ValueError:
-                    # Key is not a valid integer
+                # Only integer keys can index a list
+                if index is not None and 0 <= index < len(current):
+                    current = current[index]
+                else:
                     return None
             else:
                 # Current is neither dict nor list
@@ -56,67 +94,65 @@ class ValueReplacerMixin:
 
         return current
 
-    def _set_nested_value(self, obj: Any, path: str, value: Any) -> None:
+    def _set_nested_value(
+        self, obj: Any, path: str, value: Any, copied: set[int] | None = None
+    ) -> None:
         """Set a value in a nested dictionary/list using dot notation.
 
         Args:
             obj: The object to modify
             path: Dot-separated path, with numeric indices for list access
             value: The value to set
+            copied: If given, the ids of containers that may be modified in place.
+                Any other dict or list on the path is replaced by a shallow copy
+                before it is modified, and the copy's id is added to the set.
         """
-        keys = path.split(".")
+        keys = _parse_path(path)
         current = obj
 
         # Navigate to the parent of the target key
-        for i, key in enumerate(keys[:-1]):
+        for i, (key, index) in enumerate(keys[:-1]):
+            # Create a list for a missing container if the next key is numeric
+            next_is_index = keys[i + 1][1] is not None
             if isinstance(current, dict):
-                if key not in current:
-                    # Determine if next key is numeric to create list or dict
-                    next_key = keys[i + 1]
-                    try:
-                        int(next_key)
-                        current[key] = []
-                    except ValueError:
-                        current[key] = {}
-                current = current[key]
+                child = current.get(key, _MISSING)
+                if child is _MISSING:
+                    child = current[key] = [] if next_is_index else {}
+                    if copied is not None:
+                        copied.add(id(child))
+                elif copied is not None:
+                    child = current[key] = _copy_if_shared(child, copied)
+                current = child
             elif isinstance(current, list):
-                try:
-                    index = int(key)
-                    # Extend list if necessary
-                    while len(current) <= index:
-                        current.append(None)
-
-                    if current[index] is None:
-                        # Determine if next key is numeric to create list or dict
-                        next_key = keys[i + 1]
-                        try:
-                            int(next_key)
-                            current[index] = []
-                        except ValueError:
-                            current[index] = {}
-
-                    current = current[index]
-                except ValueError:
+                if index is None:
                     # Can't traverse further with non-numeric key on list
                     return
+
+                # Extend list if necessary
+                while len(current) <= index:
+                    current.append(None)
+
+                if current[index] is None:
+                    current[index] = [] if next_is_index else {}
+                    if copied is not None:
+                        copied.add(id(current[index]))
+                elif copied is not None:
+                    current[index] = _copy_if_shared(current[index], copied)
+
+                current = current[index]
             else:
                 # Can't traverse further
                 return
 
         # Set the final value
-        final_key = keys[-1]
+        final_key, final_index = keys[-1]
         if isinstance(current, dict):
             current[final_key] = value
-        elif isinstance(current, list):
-            try:
-                index = int(final_key)
-                # Extend list if necessary
-                while len(current) <= index:
-                    current.append(None)
-                current[index] = value
-            except ValueError:
-                # Can't set non-numeric key on list
-                pass
+        elif isinstance(current, list) and final_index is not None:
+            # Extend list if necessary
+            while len(current) <= final_index:
+                current.append(None)
+            current[final_index] = value
 
     def _apply_replacements(self, obj: Any, replacements: dict[str, Any]) -> Any:
         """Apply replacement values to an object using dot notation paths.
@@ -126,16 +162,19 @@ class ValueReplacerMixin:
             replacements: Dict mapping dot-notated paths to replacement values
 
         Returns:
-            A deep copy of the object with replacements applied
+            A copy of the object with replacements applied. Only the containers
+            along the replacement paths are copied; all other branches are shared
+            with the original object, which is never modified.
         """
         if not replacements:
             return obj
 
-        # Deep copy the object to avoid modifying the original
-        modified_obj = copy.deepcopy(obj)
+        # Copy on write: containers are shallow-copied as the paths reach them
+        copied: set[int] = set()
+        modified_obj = _copy_if_shared(obj, copied)
 
         for path, replacement_value in replacements.items():
-            self._set_nested_value(modified_obj, path, replacement_value)
+            self._set_nested_value(modified_obj, path, replacement_value, copied)
 
         return modified_obj
 
@@ -160,17 +199,15 @@ class ValueReplacerMixin:
         """
         # Store previous replacement values
         old_request_replacements = self._request_replacements
-        old_response_replacements = getattr(self, "_response_replacements", {})
+        old_response_replacements = self._response_replacements
 
         # Set new replacement values
         self._request_replacements = request or {}
-        if hasattr(self, "_response_replacements"):
-            self._response_replacements = response or {}
+        self._response_replacements = response or {}
 
         try:
             yield
         finally:
             # Restore previous replacement values
             self._request_replacements = old_request_replacements
-            if hasattr(self, "_response_replacements"):
-                self._response_replacements = old_response_replacements
+            self._response_replacements = old_response_replacements